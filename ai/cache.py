@@ -0,0 +1,96 @@
+"""
+LLM Cache - Persistent response cache for AI prompts.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Optional
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".perfwatch" / "llm_cache.sqlite"
+
+
+class LLMCache:
+    """SHA-256 keyed response cache backed by memory and SQLite."""
+
+    def __init__(self, path: Optional[Path] = None, enabled: bool = True):
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.enabled = enabled
+        self.stats = {"hits": 0, "misses": 0}
+        self._memory: dict[str, tuple[str, float]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_available = True
+
+    @staticmethod
+    def make_key(model: str, prompt: str) -> str:
+        """Build the cache key for a (model, prompt) pair."""
+        payload = json.dumps({"model": model, "prompt": prompt}, sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None on miss/expiry."""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+
+        entry = self._memory.get(key)
+        if entry is None:
+            conn = self._connect()
+            if conn is not None:
+                # A locked or broken database is treated as a miss
+                try:
+                    row = conn.execute(
+                        "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error:
+                    row = None
+                if row:
+                    entry = (row[0], row[1])
+                    self._memory[key] = entry
+
+        if entry is None or entry[1] < now:
+            self.stats["misses"] += 1
+            return None
+
+        self.stats["hits"] += 1
+        return entry[0]
+
+    def set(self, key: str, value: str, ttl: int = 86400):
+        """Store value under key for ttl seconds."""
+        if not self.enabled:
+            return
+
+        expires_at = time.time() + ttl
+        self._memory[key] = (value, expires_at)
+
+        conn = self._connect()
+        if conn is not None:
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, expires_at),
+                )
+                conn.commit()
+            except sqlite3.Error:
+                pass
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite backend lazily; fall back to memory-only on failure."""
+        if self._conn is None and self._disk_available:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(self.path)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS llm_cache "
+                    "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+                )
+                conn.execute("DELETE FROM llm_cache WHERE expires_at < ?", (time.time(),))
+                conn.commit()
+                self._conn = conn
+            except (OSError, sqlite3.Error):
+                self._disk_available = False
+        return self._conn
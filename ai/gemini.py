@@ -3,34 +3,93 @@ Gemini Client - Google Gemini AI integration.
 """
 
 import os
-import json
-from typing import Optional
+import atexit
+import logging
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import AsyncIterator, Optional
 from dotenv import load_dotenv
 
+from ai.cache import LLMCache
+from utils.scoring import classify_score
+from utils.serializer import dumps
+from ai.prompts import (
+    PROMPT_DATA_SEPARATOR,
+    RECOMMENDATION_PROMPT_PREFIX,
+    ISSUE_ANALYSIS_PROMPT_PREFIX,
+)
+
+try:
+    from google import genai
+except ImportError:
+    genai = None
+
 load_dotenv()
 
+# The Gemini SDK is synchronous; share one bounded pool for all blocking calls
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("PERFWATCH_AI_WORKERS", "4")),
+    thread_name_prefix="gemini-sdk",
+)
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
+
+# Serializes the first build, which loads the embedding model, across executor threads
+_SEMANTIC_CACHE_LOCK = threading.Lock()
+
+
+def _get_semantic_cache():
+    """
+    Return the shared semantic cache if enabled in config, else None.
+    
+    The first call loads the embedding model, so run this in the executor.
+    """
+    # Settings stay cached on config until Config.reload(); the cache below
+    # is keyed on them, so reloaded values build a fresh one
+    from utils.config import config
+    if not config.ai_semantic_cache_enabled:
+        return None
+    with _SEMANTIC_CACHE_LOCK:
+        return _build_semantic_cache(config.ai_semantic_cache_threshold, config.ai_semantic_cache_ttl)
+
+
+@lru_cache(maxsize=1)
+def _build_semantic_cache(threshold: float, ttl: int):
+    """Build the semantic cache for one set of settings, or None if unavailable."""
+    from ai.semantic_cache import SemanticCache
+    try:
+        return SemanticCache(threshold=threshold, ttl=ttl)
+    except ImportError as e:
+        logging.getLogger("perfwatch").warning(f"Semantic cache disabled: {e}")
+        return None
+
 
 class GeminiClient:
     """Google Gemini AI client for performance analysis."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, use_cache: bool = True):
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
         self.client = None
         
         # Load model from config
         from utils.config import config
-        self.model_name = config.get_ai_model()
+        self.model_name, self.cache_ttl = config.ai_model, config.ai_cache_ttl
+        
+        # Identical (model, prompt) pairs are answered from the response cache
+        self.cache = LLMCache(enabled=use_cache)
         
         if self.api_key:
             self._initialize()
     
     def _initialize(self):
         """Initialize the Gemini client."""
+        if genai is None:
+            raise ImportError("google-genai package not installed. Run: pip install google-genai")
+        
         try:
-            from google import genai
             self.client = genai.Client(api_key=self.api_key)
-        except ImportError:
-            raise ImportError("google-genai package not installed. Run: pip install google-genai")
         except Exception as e:
             raise Exception(f"Failed to initialize Gemini: {e}")
     
@@ -45,16 +104,34 @@ class GeminiClient:
         Returns:
             String with recommendations
         """
+        chunks = [chunk async for chunk in self.stream_performance_recommendations(results, url)]
+        return "".join(chunks)
+    
+    async def stream_performance_recommendations(self, results: dict, url: str) -> AsyncIterator[str]:
+        """
+        Stream performance recommendations as they are generated.
+        
+        Args:
+            results: Dict containing test results (pagespeed, seo, loadtest)
+            url: The analyzed URL
+        
+        Yields:
+            Text chunks of the recommendations
+        """
         if not self.client:
-            return "AI recommendations unavailable: No API key configured"
+            yield "AI recommendations unavailable: No API key configured"
+            return
         
         prompt = self._build_recommendation_prompt(results, url)
+        if not prompt:
+            yield "AI recommendations skipped: No test results to analyze"
+            return
         
         try:
-            response = await self._generate_async(prompt)
-            return response
+            async for chunk in self._generate_stream(prompt):
+                yield chunk
         except Exception as e:
-            return f"Failed to generate recommendations: {e}"
+            yield f"Failed to generate recommendations: {e}"
     
     async def analyze_issues(self, issues: list, context: str = "") -> str:
         """
@@ -67,23 +144,17 @@ class GeminiClient:
         Returns:
             String with analysis and solutions
         """
-        if not self.model:
+        if not self.client:
             return "AI analysis unavailable: No API key configured"
         
-        prompt = f"""As a web performance expert, analyze these issues and provide solutions:
+        prompt = (
+            ISSUE_ANALYSIS_PROMPT_PREFIX
+            + PROMPT_DATA_SEPARATOR
+            + f"""Context: {context if context else "Web performance audit"}
 
 Issues:
-{json.dumps(issues, indent=2)}
-
-Context: {context if context else "Web performance audit"}
-
-Provide:
-1. Priority ranking (which to fix first)
-2. Specific solutions for each issue
-3. Expected improvement from each fix
-4. Code examples where applicable
-
-Be concise and actionable."""
+{dumps(issues)}"""
+        )
         
         try:
             response = await self._generate_async(prompt)
@@ -93,80 +164,119 @@ Be concise and actionable."""
     
     async def _generate_async(self, prompt: str) -> str:
         """Generate response from Gemini (async wrapper)."""
-        import asyncio
+        # Near-identical prompts (e.g. the same issue with different timings)
+        # can reuse an earlier answer. Loading the embedding model and
+        # embedding are blocking, so both stay off the loop.
+        loop = asyncio.get_running_loop()
+        semantic_cache = None
+        if self.cache.enabled:
+            semantic_cache = await loop.run_in_executor(_EXECUTOR, _get_semantic_cache)
+        
+        if semantic_cache is not None:
+            _, cached = await loop.run_in_executor(
+                _EXECUTOR, semantic_cache.lookup, self.model_name, prompt
+            )
+            if cached is not None:
+                return cached
+        
+        chunks = [chunk async for chunk in self._generate_stream(prompt)]
+        response = "".join(chunks)
+        
+        if semantic_cache is not None and response:
+            await loop.run_in_executor(
+                _EXECUTOR, semantic_cache.add, self.model_name, prompt, response
+            )
+        
+        return response
+    
+    async def _generate_stream(self, prompt: str) -> AsyncIterator[str]:
+        """Stream response chunks from Gemini as they arrive."""
+        cache_key = self.cache.make_key(self.model_name, prompt)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
         
-        # Run in executor since the SDK is synchronous
-        loop = asyncio.get_event_loop()
+        # Run in executor since the SDK is synchronous; chunks are handed
+        # back to the event loop through a queue
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
         model_name = self.model_name
         client = self.client
         
         def generate():
-            response = client.models.generate_content(
-                model=model_name,
-                contents=prompt
-            )
-            return response.text
+            try:
+                for chunk in client.models.generate_content_stream(
+                    model=model_name,
+                    contents=prompt
+                ):
+                    if chunk.text:
+                        loop.call_soon_threadsafe(queue.put_nowait, chunk.text)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, done)
         
-        response = await loop.run_in_executor(None, generate)
-        return response
+        future = loop.run_in_executor(_EXECUTOR, generate)
+        parts = []
+        
+        while True:
+            item = await queue.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            parts.append(item)
+            yield item
+        
+        await future
+        
+        response = "".join(parts)
+        if response:
+            self.cache.set(cache_key, response, ttl=self.cache_ttl)
     
     def _build_recommendation_prompt(self, results: dict, url: str) -> str:
-        """Build prompt for performance recommendations."""
+        """Build prompt for performance recommendations ("" if there is no data)."""
         
-        # Extract key metrics
-        metrics_summary = []
+        # Static instructions first, request-specific data last; every
+        # section appends lines to one list that is joined once at the end
+        parts = [RECOMMENDATION_PROMPT_PREFIX + PROMPT_DATA_SEPARATOR + f"URL: {url}", ""]
+        append = parts.append
+        pagespeed = results.get("pagespeed") or {}
         
         # PageSpeed scores
-        if "pagespeed" in results and "scores" in results["pagespeed"]:
-            scores = results["pagespeed"]["scores"]
-            metrics_summary.append("Performance Scores:")
+        scores = pagespeed.get("scores")
+        if scores:
+            append("Performance Scores:")
             for metric, score in scores.items():
-                status = "Good" if score >= 90 else "Needs Improvement" if score >= 50 else "Poor"
-                metrics_summary.append(f"  - {metric}: {score:.0f} ({status})")
+                append(f"  - {metric}: {score:.0f} ({classify_score(score)[0]})")
         
         # Web Vitals
-        if "pagespeed" in results and "web_vitals" in results["pagespeed"]:
-            metrics_summary.append("\nCore Web Vitals:")
-            for metric, data in results["pagespeed"]["web_vitals"].items():
-                value = data.get("displayValue", "N/A")
-                metrics_summary.append(f"  - {metric}: {value}")
+        web_vitals = pagespeed.get("web_vitals")
+        if web_vitals:
+            append("\nCore Web Vitals:")
+            for metric, data in web_vitals.items():
+                append(f"  - {metric}: {data.get('displayValue', 'N/A')}")
         
         # Load Test
-        if "loadtest" in results:
-            lt = results["loadtest"]
-            metrics_summary.append("\nLoad Test Results:")
-            metrics_summary.append(f"  - Avg Response Time: {lt.get('avg_response_time', 0):.2f}ms")
-            metrics_summary.append(f"  - Success Rate: {lt.get('success_rate', 0):.1f}%")
-            metrics_summary.append(f"  - Requests/sec: {lt.get('rps', 0):.2f}")
+        lt = results.get("loadtest")
+        if lt is not None:
+            append("\nLoad Test Results:")
+            append(f"  - Avg Response Time: {lt.get('avg_response_time', 0):.2f}ms")
+            append(f"  - Success Rate: {lt.get('success_rate', 0):.1f}%")
+            append(f"  - Requests/sec: {lt.get('rps', 0):.2f}")
         
         # SEO
-        if "seo" in results:
-            seo = results["seo"]
-            metrics_summary.append("\nSEO Analysis:")
-            metrics_summary.append(f"  - Title: {'✓' if seo.get('title') else '✗ Missing'}")
-            metrics_summary.append(f"  - Meta Description: {'✓' if seo.get('meta_description') else '✗ Missing'}")
-            metrics_summary.append(f"  - HTTPS: {'✓' if seo.get('https') else '✗ Not enabled'}")
-        
-        # Build prompt
-        prompt = f"""You are a web performance expert. Analyze these website performance results and provide actionable recommendations.
-
-URL: {url}
-
-{chr(10).join(metrics_summary)}
-
-Provide recommendations in this format:
-1. **Critical Issues** (fix immediately)
-2. **High Priority** (fix soon)
-3. **Medium Priority** (nice to have)
-
-For each recommendation:
-- Explain what the issue is
-- Why it matters
-- How to fix it (be specific)
-- Expected improvement
-
-Keep it concise but actionable. Use bullet points.
-Do NOT use markdown headers beyond what's specified above.
-Limit to top 5-7 recommendations."""
+        seo = results.get("seo")
+        if seo is not None:
+            append("\nSEO Analysis:")
+            append(f"  - Title: {'✓' if seo.get('title') else '✗ Missing'}")
+            append(f"  - Meta Description: {'✓' if seo.get('meta_description') else '✗ Missing'}")
+            append(f"  - HTTPS: {'✓' if seo.get('https') else '✗ Not enabled'}")
+        
+        # Nothing beyond the header means there is nothing to analyze
+        if len(parts) == 2:
+            return ""
         
-        return prompt
+        return "\n".join(parts)
@@ -2,6 +2,38 @@
 AI Prompts - Prompt templates for AI analysis.
 """
 
+# Static instruction blocks go first so repeated calls share an identical
+# leading prefix (Gemini's implicit prompt cache matches on it); the
+# per-request data is appended after PROMPT_DATA_SEPARATOR.
+PROMPT_DATA_SEPARATOR = "\n\n---\n"
+
+RECOMMENDATION_PROMPT_PREFIX = """You are a web performance expert. Analyze the website performance results below and provide actionable recommendations.
+
+Provide recommendations in this format:
+1. **Critical Issues** (fix immediately)
+2. **High Priority** (fix soon)
+3. **Medium Priority** (nice to have)
+
+For each recommendation:
+- Explain what the issue is
+- Why it matters
+- How to fix it (be specific)
+- Expected improvement
+
+Keep it concise but actionable. Use bullet points.
+Do NOT use markdown headers beyond what's specified above.
+Limit to top 5-7 recommendations."""
+
+ISSUE_ANALYSIS_PROMPT_PREFIX = """As a web performance expert, analyze the issues below and provide solutions.
+
+Provide:
+1. Priority ranking (which to fix first)
+2. Specific solutions for each issue
+3. Expected improvement from each fix
+4. Code examples where applicable
+
+Be concise and actionable."""
+
 PERFORMANCE_ANALYSIS_PROMPT = """You are a web performance expert analyzing test results.
 
 Given the following performance data, provide a detailed analysis:
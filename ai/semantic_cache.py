@@ -0,0 +1,142 @@
+"""
+Semantic Cache - Similarity-based response cache for AI prompts.
+"""
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # optional: pip install perfwatch[semantic]
+    SentenceTransformer = None
+
+
+DEFAULT_INDEX_PATH = Path.home() / ".perfwatch" / "semantic_cache.faiss"
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# Neighbours inspected per lookup, so entries for other AI models or
+# expired entries don't hide a usable match
+_SEARCH_DEPTH = 5
+
+
+class SemanticCache:
+    """Response cache that matches prompts by embedding cosine similarity."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        threshold: float = 0.92,
+        ttl: int = 86400,
+        embedding_model: str = DEFAULT_EMBEDDING_MODEL,
+    ):
+        if SentenceTransformer is None:
+            raise ImportError(
+                "Semantic cache requires sentence-transformers and faiss-cpu. "
+                "Run: pip install perfwatch[semantic]"
+            )
+
+        self.path = Path(path) if path else DEFAULT_INDEX_PATH
+        self.entries_path = self.path.with_suffix(".json")
+        self.threshold = threshold
+        self.ttl = ttl
+        self.stats = {"hits": 0, "misses": 0}
+        self._encoder = SentenceTransformer(embedding_model)
+        self._index = None
+        self._entries: list[dict] = []
+        # Callers run on a thread pool and faiss releases the GIL, so the
+        # index, its entries and the files on disk are only touched under this
+        self._lock = threading.Lock()
+        self._load()
+
+    def lookup(self, model: str, prompt: str) -> tuple[float, Optional[str]]:
+        """
+        Find the closest cached response for a prompt.
+
+        Returns:
+            (similarity, text) where text is None unless the best usable
+            match for this AI model reaches the threshold
+        """
+        vector = self._embed(prompt)
+        with self._lock:
+            return self._lookup_locked(model, vector)
+
+    def _lookup_locked(self, model: str, vector) -> tuple[float, Optional[str]]:
+        """Search the index for an embedded prompt; the caller holds self._lock."""
+        if self._index.ntotal == 0:
+            self.stats["misses"] += 1
+            return 0.0, None
+
+        scores, ids = self._index.search(vector, min(_SEARCH_DEPTH, self._index.ntotal))
+        now = time.time()
+
+        for score, idx in zip(scores[0], ids[0]):
+            if idx < 0:
+                continue
+            entry = self._entries[idx]
+            if entry["model"] != model or entry["expires_at"] < now:
+                continue
+            if score >= self.threshold:
+                self.stats["hits"] += 1
+                return float(score), entry["text"]
+            self.stats["misses"] += 1
+            return float(score), None
+
+        self.stats["misses"] += 1
+        return 0.0, None
+
+    def add(self, model: str, prompt: str, text: str):
+        """Store a response under the embedding of its prompt."""
+        vector = self._embed(prompt)
+        with self._lock:
+            self._index.add(vector)
+            self._entries.append({"model": model, "text": text, "expires_at": time.time() + self.ttl})
+            self._save()
+
+    def _embed(self, prompt: str):
+        # Normalized vectors make inner product equal to cosine similarity
+        vectors = self._encoder.encode([prompt], normalize_embeddings=True)
+        return np.asarray(vectors, dtype="float32")
+
+    def _load(self):
+        """Load the persisted index, dropping expired entries."""
+        try:
+            if self.path.exists() and self.entries_path.exists():
+                index = faiss.read_index(str(self.path))
+                entries = json.loads(self.entries_path.read_text(encoding="utf-8"))
+                if index.ntotal == len(entries):
+                    self._index, self._entries = index, entries
+        except (OSError, ValueError, RuntimeError):
+            pass
+
+        if self._index is None:
+            self._index = faiss.IndexFlatIP(self._encoder.get_sentence_embedding_dimension())
+            self._entries = []
+            return
+
+        now = time.time()
+        keep = [i for i, entry in enumerate(self._entries) if entry["expires_at"] >= now]
+        if len(keep) < len(self._entries):
+            vectors = self._index.reconstruct_n(0, self._index.ntotal)[keep]
+            self._index = faiss.IndexFlatIP(self._index.d)
+            if keep:
+                self._index.add(vectors)
+            self._entries = [self._entries[i] for i in keep]
+            self._save()
+
+    def _save(self):
+        """
+        Persist the index and its entries; the cache stays usable in memory on failure.
+
+        Callers hold self._lock (or are still in __init__), so writes never overlap.
+        """
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            faiss.write_index(self._index, str(self.path))
+            self.entries_path.write_text(json.dumps(self._entries), encoding="utf-8")
+        except (OSError, RuntimeError):
+            pass
@@ -3,16 +3,47 @@ Perfwatch CLI - Main entry point.
 AI-Powered Website Performance Testing Tool.
 """
 
+import importlib
 import typer
+from typer.core import TyperGroup
 from rich.console import Console
 from rich.panel import Panel
 from typing import Optional
 
-from cli.commands import audit, lighthouse, loadtest, seo, init as init_cmd, report
+# Sub-commands: name -> (module, help). Modules are imported on first use so
+# `perfwatch --version` and the welcome screen don't load httpx, the AI SDK, etc.
+_LAZY_COMMANDS = {
+    "audit": ("cli.commands.audit", "Run full website performance audit"),
+    "lighthouse": ("cli.commands.lighthouse", "Run Lighthouse performance analysis"),
+    "loadtest": ("cli.commands.loadtest", "Run load/stress testing"),
+    "seo": ("cli.commands.seo", "Run SEO analysis"),
+    "init": ("cli.commands.init", "Initialize Perfwatch configuration"),
+    "report": ("cli.commands.report", "Generate reports from sessions"),
+}
+
+
+class LazyTyperGroup(TyperGroup):
+    """Typer group that imports sub-command modules on demand."""
+    
+    def list_commands(self, ctx) -> list[str]:
+        names = list(super().list_commands(ctx))
+        return names + [name for name in _LAZY_COMMANDS if name not in names]
+    
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name in _LAZY_COMMANDS and cmd_name not in self.commands:
+            module_name, help_text = _LAZY_COMMANDS[cmd_name]
+            module = importlib.import_module(module_name)
+            command = typer.main.get_group(module.app)
+            command.name = cmd_name
+            command.help = help_text
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
 
 # Create the main Typer app
 app = typer.Typer(
     name="perfwatch",
+    cls=LazyTyperGroup,
     help="🚀 AI-Powered Website Performance Testing CLI Tool",
     add_completion=False,
     rich_markup_mode="rich",
@@ -20,14 +51,6 @@ app = typer.Typer(
 
 console = Console()
 
-# Register sub-commands
-app.add_typer(audit.app, name="audit", help="Run full website performance audit")
-app.add_typer(lighthouse.app, name="lighthouse", help="Run Lighthouse performance analysis")
-app.add_typer(loadtest.app, name="loadtest", help="Run load/stress testing")
-app.add_typer(seo.app, name="seo", help="Run SEO analysis")
-app.add_typer(init_cmd.app, name="init", help="Initialize Perfwatch configuration")
-app.add_typer(report.app, name="report", help="Generate reports from sessions")
-
 
 @app.callback(invoke_without_command=True)
 def main(
@@ -3,28 +3,69 @@ Audit Command - Full website performance audit.
 """
 
 import asyncio
+import os
+import time
 from datetime import datetime
 from pathlib import Path
+from string import Template
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from utils.validator import validate_url, normalize_url
+from utils.validator import validate_urls, normalize_url
 from utils.logger import print_header, print_success, print_error, print_score_table, format_duration
+from utils.scoring import classify_score
+from utils.paths import ensure_dir, slugify_url
 
 app = typer.Typer(help="Run full website performance audit")
 console = Console()
 
+# Pre-minified; inlined into every HTML report
+_CSS = (
+    "*{margin:0;padding:0;box-sizing:border-box}"
+    "body{font-family:-apple-system,BlinkMacSystemFont,'Segoe UI',Roboto,sans-serif;background:#0f172a;color:#e2e8f0;padding:2rem}"
+    ".container{max-width:1200px;margin:0 auto}"
+    "h1{color:#22d3ee;margin-bottom:0.5rem}"
+    ".meta{color:#64748b;margin-bottom:2rem}"
+    ".card{background:#1e293b;border-radius:12px;padding:1.5rem;margin-bottom:1.5rem}"
+    ".card h2{color:#22d3ee;margin-bottom:1rem;font-size:1.2rem}"
+    ".score-item{display:flex;justify-content:space-between;padding:0.5rem 0;border-bottom:1px solid #334155}"
+    ".score{font-weight:bold;font-size:1.2rem}"
+    ".metric{color:#94a3b8}"
+)
+
+# Parsed once at import; only the per-report fields are substituted
+_HTML_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Perfwatch Report - $url</title>
+    <style>$css</style>
+</head>
+<body>
+    <div class="container">
+        <h1>🚀 Perfwatch Report</h1>
+        <p class="meta">URL: $url | Session: $session_id</p>
+        
+        <div class="card">
+            <h2>Performance Scores</h2>
+            $scores_html
+        </div>
+    </div>
+</body>
+</html>""")
+
 
 @app.callback(invoke_without_command=True)
 def audit(
     ctx: typer.Context,
-    url: str = typer.Option(..., "--url", "-u", help="Target URL to audit"),
+    urls: list[str] = typer.Option(..., "--url", "-u", help="Target URL to audit (repeat to audit several URLs)"),
     output: str = typer.Option("reports", "--output", "-o", help="Output directory for reports"),
     format: str = typer.Option("html", "--format", "-f", help="Report format: html, json, md"),
     ai: bool = typer.Option(True, "--ai/--no-ai", help="Enable AI-powered recommendations"),
+    cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse cached AI responses for identical prompts"),
+    cache_stats: bool = typer.Option(False, "--cache-stats", help="Show AI cache hit/miss statistics"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ):
     """
@@ -38,111 +79,165 @@ def audit(
     - Load Testing
     """
     
-    # Validate URL
-    is_valid, error = validate_url(url)
-    if not is_valid:
-        print_error(f"Invalid URL: {error}")
-        raise typer.Exit(1)
+    # Validate URLs
+    targets = []
+    for url, (is_valid, error) in zip(urls, validate_urls(urls)):
+        if not is_valid:
+            print_error(f"Invalid URL: {error}")
+            raise typer.Exit(1)
+        targets.append(normalize_url(url))
     
-    url = normalize_url(url)
+    # Drop duplicates, keeping the order given
+    targets = list(dict.fromkeys(targets))
     
-    print_header("Perfwatch Full Audit", f"Target: {url}")
+    if len(targets) == 1:
+        print_header("Perfwatch Full Audit", f"Target: {targets[0]}")
+    else:
+        print_header("Perfwatch Full Audit", f"Targets: {len(targets)} URLs")
     
     # Create session ID
     session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_dir = Path(output)
-    output_dir.mkdir(exist_ok=True)
+    output_dir = ensure_dir(output)
     
     console.print(f"[dim]Session ID: {session_id}[/dim]")
     console.print()
     
-    # Run the audit
-    asyncio.run(_run_audit(url, session_id, output_dir, format, ai, verbose))
+    # Run every audit in a single event loop
+    asyncio.run(_run_batch(targets, session_id, output_dir, format, ai, cache, cache_stats, verbose))
 
 
-async def _run_audit(url: str, session_id: str, output_dir: Path, format: str, ai: bool, verbose: bool):
-    """Run the full audit asynchronously."""
+async def _run_batch(
+    urls: list[str],
+    session_id: str,
+    output_dir: Path,
+    format: str,
+    ai: bool,
+    cache: bool,
+    cache_stats: bool,
+    verbose: bool,
+):
+    """Audit all URLs concurrently, then report on each in order."""
     
-    from tools.pagespeed import PageSpeedTool
-    from tools.seo import SEOTool
-    from tools.loadtest import LoadTestTool
+    import httpx
+    from rich.progress import Progress, SpinnerColumn, TextColumn
     
-    results = {}
-    start_time = datetime.now()
+    batch = len(urls) > 1
+    semaphore = asyncio.Semaphore(int(os.getenv("PERFWATCH_MAX_CONCURRENT", "4")))
+    start_time = time.perf_counter()
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console
-    ) as progress:
-        
-        # 1. PageSpeed Analysis
-        task1 = progress.add_task("[cyan]Running PageSpeed analysis...", total=None)
-        try:
-            pagespeed = PageSpeedTool()
-            pagespeed_result = await pagespeed.analyze(url)
-            results["pagespeed"] = pagespeed_result
-            progress.update(task1, description="[green]✓ PageSpeed analysis complete")
-        except Exception as e:
-            progress.update(task1, description=f"[red]✗ PageSpeed failed: {e}")
-            results["pagespeed"] = {"error": str(e)}
-        
-        # 2. SEO Analysis
-        task2 = progress.add_task("[cyan]Running SEO analysis...", total=None)
-        try:
-            seo = SEOTool()
-            seo_result = await seo.analyze(url)
-            results["seo"] = seo_result
-            progress.update(task2, description="[green]✓ SEO analysis complete")
-        except Exception as e:
-            progress.update(task2, description=f"[red]✗ SEO failed: {e}")
-            results["seo"] = {"error": str(e)}
-        
-        # 3. Load Test (quick)
-        task3 = progress.add_task("[cyan]Running quick load test...", total=None)
-        try:
-            loadtest = LoadTestTool()
-            loadtest_result = await loadtest.run(url, requests=10, concurrent=5)
-            results["loadtest"] = loadtest_result
-            progress.update(task3, description="[green]✓ Load test complete")
-        except Exception as e:
-            progress.update(task3, description=f"[red]✗ Load test failed: {e}")
-            results["loadtest"] = {"error": str(e)}
+    # One client for all tools so connections to the target hosts are reused
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    ) as http:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console
+        ) as progress:
+            
+            async def bounded(url: str) -> dict:
+                async with semaphore:
+                    return await _run_audit(url, http, progress, label=url if batch else "")
+            
+            all_results = await asyncio.gather(*(bounded(url) for url in urls))
     
     # Calculate duration
-    duration = (datetime.now() - start_time).total_seconds()
+    duration = time.perf_counter() - start_time
     
     console.print()
     console.print(f"[dim]Audit completed in {format_duration(duration)}[/dim]")
     console.print()
     
-    # Display results
-    _display_results(results)
+    # Name reports after their URL; the session id is shared by the batch
+    seen: set[str] = set()
+    
+    for index, (url, results) in enumerate(zip(urls, all_results), start=1):
+        slug = slugify_url(url)
+        if slug in seen:
+            slug = f"{slug}-{index}"
+        seen.add(slug)
+        report_file = output_dir / f"audit_{session_id}_{slug}.{format}"
+        
+        if batch:
+            print_header("Audit Results", url)
+        
+        # Display results
+        _display_results(results)
+        
+        # AI Recommendations
+        if ai:
+            if _has_signal(results):
+                await _get_ai_recommendations(results, url, cache, cache_stats)
+            else:
+                console.print("[yellow]⚠[/yellow] Skipping AI recommendations: all tests failed")
+        
+        # Save report
+        _save_report(results, report_file, format, url, session_id)
+        
+        console.print()
+        print_success(f"Report saved to: {report_file}")
+
+
+async def _run_audit(url: str, http, progress, label: str = "") -> dict:
+    """Run PageSpeed, SEO and a quick load test for one URL."""
+    
+    from tools.pagespeed import PageSpeedTool
+    from tools.seo import SEOTool
+    from tools.loadtest import LoadTestTool
     
-    # AI Recommendations
-    if ai:
-        await _get_ai_recommendations(results, url)
+    prefix = f"{label}: " if label else ""
     
-    # Save report
-    report_file = output_dir / f"audit_{session_id}.{format}"
-    _save_report(results, report_file, format, url, session_id)
+    # All three tools are independent and network-bound, so run them concurrently
+    pagespeed_task = progress.add_task(f"[cyan]{prefix}Running PageSpeed analysis...", total=None)
+    seo_task = progress.add_task(f"[cyan]{prefix}Running SEO analysis...", total=None)
+    loadtest_task = progress.add_task(f"[cyan]{prefix}Running quick load test...", total=None)
     
-    console.print()
-    print_success(f"Report saved to: {report_file}")
+    async def run_step(coro, task_id, done_label: str, failed_label: str) -> dict:
+        try:
+            result = await coro
+            progress.update(task_id, description=f"[green]✓ {prefix}{done_label}")
+            return result
+        except Exception as e:
+            progress.update(task_id, description=f"[red]✗ {prefix}{failed_label}: {e}")
+            return {"error": str(e)}
+    
+    pagespeed_result, seo_result, loadtest_result = await asyncio.gather(
+        run_step(PageSpeedTool(http=http).analyze(url), pagespeed_task,
+                 "PageSpeed analysis complete", "PageSpeed failed"),
+        run_step(SEOTool(http=http).analyze(url), seo_task,
+                 "SEO analysis complete", "SEO failed"),
+        run_step(LoadTestTool(http=http).run(url, requests=10, concurrent=5), loadtest_task,
+                 "Load test complete", "Load test failed"),
+    )
+    
+    return {
+        "pagespeed": pagespeed_result,
+        "seo": seo_result,
+        "loadtest": loadtest_result,
+    }
+
+
+def _has_signal(results: dict) -> bool:
+    """Return True if at least one test produced usable results."""
+    return any(v and "error" not in v for v in results.values())
 
 
 def _display_results(results: dict):
     """Display audit results in a formatted table."""
+    from rich.table import Table
     
     # Performance Scores
-    if "pagespeed" in results and "error" not in results["pagespeed"]:
-        ps = results["pagespeed"]
-        if "scores" in ps:
-            print_score_table(ps["scores"], "Performance Scores")
+    ps = results.get("pagespeed") or {}
+    if "error" not in ps:
+        scores = ps.get("scores")
+        if scores:
+            print_score_table(scores, "Performance Scores")
     
     # SEO Summary
-    if "seo" in results and "error" not in results["seo"]:
-        seo = results["seo"]
+    seo = results.get("seo")
+    if seo is not None and "error" not in seo:
         console.print("[bold]SEO Summary[/bold]")
         if "title" in seo:
             console.print(f"  Title: [cyan]{seo.get('title', 'N/A')}[/cyan]")
@@ -154,8 +249,8 @@ def _display_results(results: dict):
         console.print()
     
     # Load Test Summary
-    if "loadtest" in results and "error" not in results["loadtest"]:
-        lt = results["loadtest"]
+    lt = results.get("loadtest")
+    if lt is not None and "error" not in lt:
         table = Table(title="Load Test Results", show_header=True, header_style="bold magenta")
         table.add_column("Metric", style="cyan")
         table.add_column("Value", justify="right")
@@ -170,25 +265,40 @@ def _display_results(results: dict):
         console.print()
 
 
-async def _get_ai_recommendations(results: dict, url: str):
+async def _get_ai_recommendations(results: dict, url: str, cache: bool, cache_stats: bool):
     """Get AI-powered recommendations based on results."""
     
     try:
+        from rich.live import Live
         from ai.gemini import GeminiClient
         
         console.print("[bold]🤖 AI Recommendations[/bold]")
         console.print("[dim]Analyzing results...[/dim]")
         console.print()
         
-        client = GeminiClient()
-        recommendations = await client.get_performance_recommendations(results, url)
+        client = GeminiClient(use_cache=cache)
+        recommendations = ""
         
-        if recommendations:
-            console.print(Panel(
+        def render() -> Panel:
+            return Panel(
                 recommendations,
                 title="[bold cyan]Performance Recommendations[/bold cyan]",
                 border_style="cyan"
-            ))
+            )
+        
+        # Show chunks as they stream in; the transient view is replaced by
+        # the final panel so long answers aren't cropped to terminal height
+        with Live(render(), console=console, refresh_per_second=8, transient=True) as live:
+            async for chunk in client.stream_performance_recommendations(results, url):
+                recommendations += chunk
+                live.update(render())
+        
+        if cache_stats:
+            stats = client.cache.stats
+            console.print(f"[dim]AI cache: {stats['hits']} hits, {stats['misses']} misses[/dim]")
+        
+        if recommendations:
+            console.print(render())
         else:
             console.print("[yellow]⚠[/yellow] Could not generate AI recommendations")
             
@@ -198,7 +308,7 @@ async def _get_ai_recommendations(results: dict, url: str):
 
 def _save_report(results: dict, filepath: Path, format: str, url: str, session_id: str):
     """Save the audit report to file."""
-    import json
+    from utils.serializer import write_json
     
     report_data = {
         "session_id": session_id,
@@ -208,7 +318,7 @@ def _save_report(results: dict, filepath: Path, format: str, url: str, session_i
     }
     
     if format == "json":
-        filepath.write_text(json.dumps(report_data, indent=2, default=str), encoding="utf-8")
+        write_json(filepath, report_data)
     
     elif format == "html":
         html = _generate_html_report(report_data)
@@ -222,49 +332,25 @@ def _save_report(results: dict, filepath: Path, format: str, url: str, session_i
 def _generate_html_report(data: dict) -> str:
     """Generate HTML report."""
     
-    scores_html = ""
-    if "pagespeed" in data["results"] and "scores" in data["results"]["pagespeed"]:
-        for metric, score in data["results"]["pagespeed"]["scores"].items():
-            color = "#22c55e" if score >= 90 else "#eab308" if score >= 50 else "#ef4444"
-            scores_html += f'<div class="score-item"><span class="metric">{metric}</span><span class="score" style="color:{color}">{score:.0f}</span></div>'
+    scores = (data["results"].get("pagespeed") or {}).get("scores") or {}
+    scores_html = "\n".join(
+        f'<div class="score-item"><span class="metric">{metric}</span>'
+        f'<span class="score" style="color:{classify_score(score)[1]}">{score:.0f}</span></div>'
+        for metric, score in scores.items()
+    )
     
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Perfwatch Report - {data['url']}</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; background: #0f172a; color: #e2e8f0; padding: 2rem; }}
-        .container {{ max-width: 1200px; margin: 0 auto; }}
-        h1 {{ color: #22d3ee; margin-bottom: 0.5rem; }}
-        .meta {{ color: #64748b; margin-bottom: 2rem; }}
-        .card {{ background: #1e293b; border-radius: 12px; padding: 1.5rem; margin-bottom: 1.5rem; }}
-        .card h2 {{ color: #22d3ee; margin-bottom: 1rem; font-size: 1.2rem; }}
-        .score-item {{ display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #334155; }}
-        .score {{ font-weight: bold; font-size: 1.2rem; }}
-        .metric {{ color: #94a3b8; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🚀 Perfwatch Report</h1>
-        <p class="meta">URL: {data['url']} | Session: {data['session_id']}</p>
-        
-        <div class="card">
-            <h2>Performance Scores</h2>
-            {scores_html if scores_html else '<p>No scores available</p>'}
-        </div>
-    </div>
-</body>
-</html>"""
+    return _HTML_TEMPLATE.substitute(
+        css=_CSS,
+        url=data["url"],
+        session_id=data["session_id"],
+        scores_html=scores_html or "<p>No scores available</p>",
+    )
 
 
 def _generate_markdown_report(data: dict) -> str:
     """Generate Markdown report."""
     
-    md = f"""# Perfwatch Report
+    parts = [f"""# Perfwatch Report
 
 **URL:** {data['url']}  
 **Session:** {data['session_id']}  
@@ -272,11 +358,12 @@ def _generate_markdown_report(data: dict) -> str:
 
 ## Performance Scores
 
-"""
+"""]
     
-    if "pagespeed" in data["results"] and "scores" in data["results"]["pagespeed"]:
-        for metric, score in data["results"]["pagespeed"]["scores"].items():
-            rating = "🟢" if score >= 90 else "🟡" if score >= 50 else "🔴"
-            md += f"- **{metric}**: {score:.0f} {rating}\n"
+    scores = (data["results"].get("pagespeed") or {}).get("scores") or {}
+    parts.extend(
+        f"- **{metric}**: {score:.0f} {classify_score(score)[2]}\n"
+        for metric, score in scores.items()
+    )
     
-    return md
+    return "".join(parts)
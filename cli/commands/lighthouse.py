@@ -3,14 +3,14 @@ Lighthouse Command - Lighthouse performance analysis.
 """
 
 import asyncio
+import time
 from datetime import datetime
-from pathlib import Path
 import typer
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from utils.validator import validate_url, normalize_url
-from utils.logger import print_header, print_success, print_error, print_score_table
+from utils.logger import print_header, print_success, print_error, print_score_table, format_duration
+from utils.paths import ensure_dir
 
 app = typer.Typer(help="Run Lighthouse performance analysis")
 console = Console()
@@ -54,8 +54,12 @@ def lighthouse(
 async def _run_lighthouse(url: str, categories: list, device: str, output: str, verbose: bool):
     """Run Lighthouse analysis."""
     
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
     from tools.pagespeed import PageSpeedTool
     
+    start_time = time.perf_counter()
+    
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -65,12 +69,12 @@ async def _run_lighthouse(url: str, categories: list, device: str, output: str,
         task = progress.add_task("[cyan]Running Lighthouse via PageSpeed API...", total=None)
         
         try:
-            tool = PageSpeedTool()
-            result = await tool.analyze(
-                url, 
-                strategy="mobile" if device == "mobile" else "desktop",
-                categories=categories
-            )
+            async with PageSpeedTool() as tool:
+                result = await tool.analyze(
+                    url, 
+                    strategy="mobile" if device == "mobile" else "desktop",
+                    categories=categories
+                )
             
             if "error" in result:
                 progress.update(task, description=f"[red]✗ {result['error']}")
@@ -84,6 +88,10 @@ async def _run_lighthouse(url: str, categories: list, device: str, output: str,
             print_error(str(e))
             return
     
+    duration = time.perf_counter() - start_time
+    
+    console.print()
+    console.print(f"[dim]Analysis completed in {format_duration(duration)}[/dim]")
     console.print()
     
     # Display scores
@@ -95,6 +103,8 @@ async def _run_lighthouse(url: str, categories: list, device: str, output: str,
         vitals = result["web_vitals"]
         console.print("[bold]Core Web Vitals[/bold]")
         
+        # Collect every row first so the section is rendered in one write
+        grid = Table.grid(padding=(0, 1), pad_edge=True)
         for metric, data in vitals.items():
             value = data.get("displayValue", "N/A")
             score = (data.get("score", 0) or 0) * 100
@@ -109,28 +119,30 @@ async def _run_lighthouse(url: str, categories: list, device: str, output: str,
                 color = "red"
                 icon = "🔴"
             
-            console.print(f"  {icon} [{color}]{metric}[/{color}]: {value}")
+            grid.add_row(icon, f"[{color}]{metric}[/{color}]:", value)
         
+        console.print(grid)
         console.print()
     
     # Display opportunities
-    if "opportunities" in result and result["opportunities"]:
-        console.print("[bold]Optimization Opportunities[/bold]")
-        for opp in result["opportunities"][:5]:
+    opportunities = result.get("opportunities")
+    if opportunities:
+        lines = ["[bold]Optimization Opportunities[/bold]"]
+        for opp in opportunities[:5]:
             savings = opp.get("savings", "")
-            console.print(f"  [yellow]→[/yellow] {opp['title']}")
+            lines.append(f"  [yellow]→[/yellow] {opp['title']}")
             if savings:
-                console.print(f"    [dim]Potential savings: {savings}[/dim]")
+                lines.append(f"    [dim]Potential savings: {savings}[/dim]")
+        console.print("\n".join(lines))
         console.print()
     
     # Save results
-    output_dir = Path(output)
-    output_dir.mkdir(exist_ok=True)
+    output_dir = ensure_dir(output)
     session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    import json
+    from utils.serializer import write_json
     report_file = output_dir / f"lighthouse_{session_id}.json"
-    report_file.write_text(json.dumps(result, indent=2, default=str), encoding="utf-8")
+    write_json(report_file, result)
     
     print_success(f"Report saved to: {report_file}")
 
@@ -3,21 +3,30 @@ Load Test Command - HTTP load/stress testing.
 """
 
 import asyncio
+import time
 from datetime import datetime
-from pathlib import Path
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn
 
 from utils.validator import validate_url, normalize_url
 from utils.logger import print_header, print_success, print_error
 from utils.config import config
+from utils.paths import ensure_dir
+from utils.eventloop import install_fast_event_loop
 
 app = typer.Typer(help="Run load/stress testing")
 console = Console()
 
+# Status code bars are capped at 50 cells, so every bar string is precomputed
+_BARS = ["█" * i for i in range(51)]
+_STATUS_COLORS = {"2": "green", "3": "yellow"}
+
+_SUMMARY_FIELDS = (
+    "total_requests", "successful", "failed", "success_rate", "rps",
+    "avg_response_time", "min_response_time", "max_response_time",
+    "p95_response_time", "p99_response_time",
+)
+
 
 @app.callback(invoke_without_command=True)
 def loadtest(
@@ -28,6 +37,9 @@ def loadtest(
     duration: int = typer.Option(None, "--duration", "-d", help="Test duration in seconds (overrides --requests)"),
     timeout: int = typer.Option(None, "--timeout", "-t", help="Request timeout in seconds"),
     method: str = typer.Option("GET", "--method", "-m", help="HTTP method: GET, POST, etc."),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent the saved JSON report"),
+    samples: bool = typer.Option(False, "--samples", help="Also save per-request samples as JSONL"),
+    http2: bool = typer.Option(False, "--http2", help="Use HTTP/2 (workers share multiplexed streams)"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ):
     """
@@ -38,9 +50,9 @@ def loadtest(
     """
     
     # Use config defaults if not specified
-    requests = requests or config.get_loadtest_requests()
-    concurrent = concurrent or config.get_loadtest_concurrent()
-    timeout = timeout or config.get_loadtest_timeout()
+    requests = requests or config.loadtest_requests
+    concurrent = concurrent or config.loadtest_concurrent
+    timeout = timeout or config.loadtest_timeout
     
     # Validate URL
     is_valid, error = validate_url(url)
@@ -56,7 +68,8 @@ def loadtest(
     console.print()
     
     # Run load test
-    asyncio.run(_run_loadtest(url, requests, concurrent, duration, timeout, method, verbose))
+    install_fast_event_loop()
+    asyncio.run(_run_loadtest(url, requests, concurrent, duration, timeout, method, pretty, samples, http2, verbose))
 
 
 async def _run_loadtest(
@@ -66,13 +79,26 @@ async def _run_loadtest(
     duration: int,
     timeout: int,
     method: str,
+    pretty: bool,
+    samples: bool,
+    http2: bool,
     verbose: bool
 ):
     """Run the load test."""
     
+    from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn
+    from contextlib import nullcontext
     from tools.loadtest import LoadTestTool
+    from utils.serializer import JsonLinesWriter, write_json
+    
+    output_dir = ensure_dir("reports")
+    session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
     
-    start_time = datetime.now()
+    # Raw samples are streamed to disk as they complete; only the summary
+    # stays in memory and goes into the JSON report
+    samples_file = output_dir / f"loadtest_{session_id}.samples.jsonl" if samples else None
+    
+    start_time = time.perf_counter()
     
     with Progress(
         TextColumn("[progress.description]{task.description}"),
@@ -85,26 +111,42 @@ async def _run_loadtest(
         
         task = progress.add_task("[cyan]Running load test...", total=total_requests)
         
+        # Rich re-renders on every update, so coalesce per-request callbacks
+        step = max(1, total_requests // 200)
+        last_completed = 0
+        last_update = time.perf_counter()
+        
         def update_progress(completed: int):
-            progress.update(task, completed=completed)
+            nonlocal last_completed, last_update
+            now = time.perf_counter()
+            if (
+                completed - last_completed >= step
+                or now - last_update >= 0.05
+                or completed >= total_requests
+            ):
+                progress.update(task, completed=completed)
+                last_completed, last_update = completed, now
         
         try:
-            tool = LoadTestTool()
-            result = await tool.run(
-                url,
-                requests=total_requests,
-                concurrent=concurrent,
-                timeout=timeout,
-                method=method,
-                progress_callback=update_progress
-            )
+            with JsonLinesWriter(samples_file) if samples_file else nullcontext() as writer:
+                tool = LoadTestTool()
+                result = await tool.run(
+                    url,
+                    requests=total_requests,
+                    concurrent=concurrent,
+                    timeout=timeout,
+                    method=method,
+                    progress_callback=update_progress,
+                    sample_callback=writer.write if writer else None,
+                    http2=http2,
+                )
             
         except Exception as e:
             print_error(f"Load test failed: {e}")
             return
     
     # Calculate duration
-    test_duration = (datetime.now() - start_time).total_seconds()
+    test_duration = time.perf_counter() - start_time
     
     console.print()
     
@@ -112,32 +154,32 @@ async def _run_loadtest(
     _display_results(result, test_duration)
     
     # Save results
-    output_dir = Path("reports")
-    output_dir.mkdir(exist_ok=True)
-    session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    import json
     report_file = output_dir / f"loadtest_{session_id}.json"
     result["test_duration"] = test_duration
-    report_file.write_text(json.dumps(result, indent=2, default=str))
+    if samples_file:
+        result["samples_file"] = samples_file.name
+    write_json(report_file, result, indent=pretty)
     
     print_success(f"Report saved to: {report_file}")
+    if samples_file:
+        print_success(f"Samples saved to: {samples_file}")
 
 
 def _display_results(result: dict, duration: float):
     """Display load test results."""
+    from rich.table import Table
     
     # Summary table
     table = Table(title="Load Test Results", show_header=True, header_style="bold magenta")
     table.add_column("Metric", style="cyan")
     table.add_column("Value", justify="right")
     
-    # Response times
-    avg_rt = result.get("avg_response_time", 0)
-    min_rt = result.get("min_response_time", 0)
-    max_rt = result.get("max_response_time", 0)
-    p95_rt = result.get("p95_response_time", 0)
-    p99_rt = result.get("p99_response_time", 0)
+    # Fetch every displayed field once
+    (
+        total_requests, successful, failed, success_rate, rps,
+        avg_rt, min_rt, max_rt, p95_rt, p99_rt,
+    ) = (result.get(key, 0) for key in _SUMMARY_FIELDS)
+    status_codes = result.get("status_codes")
     
     # Color code based on response time
     def format_time(ms: float) -> str:
@@ -148,10 +190,10 @@ def _display_results(result: dict, duration: float):
         else:
             return f"[red]{ms:.2f}ms[/red]"
     
-    table.add_row("Total Requests", str(result.get("total_requests", 0)))
-    table.add_row("Successful", f"[green]{result.get('successful', 0)}[/green]")
-    table.add_row("Failed", f"[red]{result.get('failed', 0)}[/red]")
-    table.add_row("Success Rate", f"{result.get('success_rate', 0):.1f}%")
+    table.add_row("Total Requests", str(total_requests))
+    table.add_row("Successful", f"[green]{successful}[/green]")
+    table.add_row("Failed", f"[red]{failed}[/red]")
+    table.add_row("Success Rate", f"{success_rate:.1f}%")
     table.add_row("─" * 20, "─" * 15)
     table.add_row("Avg Response Time", format_time(avg_rt))
     table.add_row("Min Response Time", format_time(min_rt))
@@ -159,19 +201,18 @@ def _display_results(result: dict, duration: float):
     table.add_row("P95 Response Time", format_time(p95_rt))
     table.add_row("P99 Response Time", format_time(p99_rt))
     table.add_row("─" * 20, "─" * 15)
-    table.add_row("Requests/sec", f"[bold]{result.get('rps', 0):.2f}[/bold]")
+    table.add_row("Requests/sec", f"[bold]{rps:.2f}[/bold]")
     table.add_row("Test Duration", f"{duration:.2f}s")
     
     console.print(table)
     console.print()
     
     # Status code distribution
-    if "status_codes" in result and result["status_codes"]:
+    if status_codes:
         console.print("[bold]Status Code Distribution[/bold]")
-        for code, count in sorted(result["status_codes"].items()):
-            color = "green" if str(code).startswith("2") else "yellow" if str(code).startswith("3") else "red"
-            bar_len = min(count, 50)
-            bar = "█" * bar_len
+        for code, count in sorted(status_codes.items()):
+            color = _STATUS_COLORS.get(str(code)[:1], "red")
+            bar = _BARS[min(count, 50)]
             console.print(f"  [{color}]{code}[/{color}] {bar} {count}")
         console.print()
     
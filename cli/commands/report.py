@@ -2,18 +2,65 @@
 Report Command - Generate and manage reports.
 """
 
-import json
+import os
+import time
 from datetime import datetime
+from html import escape
 from pathlib import Path
+from string import Template
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from utils.logger import print_header, print_success, print_error
+from utils.serializer import dumps, read_json
 
 app = typer.Typer(help="Generate and manage reports")
 console = Console()
 
+# Report files are named "<type>_<session>...", so the prefix identifies them
+_REPORT_TYPES = {
+    "audit": "Full Audit",
+    "lighthouse": "Lighthouse",
+    "loadtest": "Load Test",
+    "seo": "SEO",
+}
+
+# Export templates, parsed once at import
+_HTML_TEMPLATE = Template("""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Perfwatch Report</title>
+    <style>
+        body { font-family: system-ui, sans-serif; background: #1a1a2e; color: #eee; padding: 2rem; }
+        .container { max-width: 800px; margin: 0 auto; }
+        h1 { color: #00d4ff; }
+        pre { background: #16213e; padding: 1rem; border-radius: 8px; overflow-x: auto; }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🚀 Perfwatch Report</h1>
+        <p>URL: $url | Session: $session</p>
+        $samples
+        <pre>$body</pre>
+    </div>
+</body>
+</html>""")
+
+_MD_TEMPLATE = Template("""# Perfwatch Report
+
+**URL:** $url  
+**Session:** $session
+
+## Results
+
+```json
+$body
+```
+""")
+
 
 @app.command("list")
 def list_reports(
@@ -21,14 +68,17 @@ def list_reports(
 ):
     """List all available reports."""
     
+    from rich.table import Table
+    
     reports_dir = Path(directory)
     
     if not reports_dir.exists():
         print_error(f"Reports directory not found: {reports_dir}")
         raise typer.Exit(1)
     
-    # Find all report files
-    reports = list(reports_dir.glob("*.json")) + list(reports_dir.glob("*.html"))
+    # Find all report files; DirEntry caches stat() so each file is stat'ed once
+    with os.scandir(reports_dir) as it:
+        reports = [e for e in it if e.is_file() and e.name.endswith((".json", ".html", ".jsonl"))]
     
     if not reports:
         console.print("[dim]No reports found.[/dim]")
@@ -40,22 +90,15 @@ def list_reports(
     table.add_column("Size", justify="right")
     table.add_column("Modified")
     
-    for report in sorted(reports, key=lambda x: x.stat().st_mtime, reverse=True):
+    reports.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    
+    for report in reports:
         stat = report.stat()
         size = f"{stat.st_size / 1024:.1f} KB"
         modified = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
         
         # Determine type from filename
-        if "audit" in report.name:
-            report_type = "Full Audit"
-        elif "lighthouse" in report.name:
-            report_type = "Lighthouse"
-        elif "loadtest" in report.name:
-            report_type = "Load Test"
-        elif "seo" in report.name:
-            report_type = "SEO"
-        else:
-            report_type = "Unknown"
+        report_type = _REPORT_TYPES.get(report.name.split("_", 1)[0], "Unknown")
         
         table.add_row(report.name, report_type, size, modified)
     
@@ -68,6 +111,7 @@ def list_reports(
 def show_report(
     filename: str = typer.Argument(..., help="Report filename"),
     directory: str = typer.Option("reports", "--dir", "-d", help="Reports directory"),
+    lines: int = typer.Option(20, "--lines", "-n", help="Samples to show from a .jsonl file"),
 ):
     """Display a report in the console."""
     
@@ -78,13 +122,24 @@ def show_report(
         raise typer.Exit(1)
     
     if report_path.suffix == ".json":
-        with open(report_path) as f:
-            data = json.load(f)
+        data = read_json(report_path)
         
         console.print()
         console.print_json(data=data)
         console.print()
     
+    elif report_path.suffix == ".jsonl":
+        # Sample files can be large; only read the first lines
+        from itertools import islice
+        
+        with report_path.open(encoding="utf-8") as f:
+            head = [line.rstrip("\n") for line in islice(f, lines)]
+        
+        console.print()
+        console.print("\n".join(head), markup=False, highlight=False)
+        console.print(f"[dim]Showing first {len(head)} samples from {report_path.name}[/dim]")
+        console.print()
+    
     elif report_path.suffix == ".html":
         console.print(f"[dim]HTML report saved at: {report_path.absolute()}[/dim]")
         console.print("[dim]Open in browser to view.[/dim]")
@@ -111,8 +166,7 @@ def export_report(
         print_error("Source must be a JSON file")
         raise typer.Exit(1)
     
-    with open(source_path) as f:
-        data = json.load(f)
+    data = read_json(source_path)
     
     # Generate output filename
     output_name = source_path.stem + f".{format}"
@@ -120,10 +174,10 @@ def export_report(
     
     if format == "html":
         html = _generate_html(data)
-        output_path.write_text(html)
+        output_path.write_text(html, encoding="utf-8")
     elif format == "md":
         md = _generate_markdown(data)
-        output_path.write_text(md)
+        output_path.write_text(md, encoding="utf-8")
     else:
         print_error(f"Unsupported format: {format}")
         raise typer.Exit(1)
@@ -148,12 +202,10 @@ def clean_reports(
         raise typer.Exit(1)
     
     # Find old reports
-    cutoff = datetime.now().timestamp() - (days * 24 * 60 * 60)
-    old_reports = []
+    cutoff = time.time() - days * 86400
     
-    for report in reports_dir.glob("*"):
-        if report.is_file() and report.stat().st_mtime < cutoff:
-            old_reports.append(report)
+    with os.scandir(reports_dir) as it:
+        old_reports = [e for e in it if e.is_file() and e.stat().st_mtime < cutoff]
     
     if not old_reports:
         console.print("[dim]No old reports found.[/dim]")
@@ -167,52 +219,29 @@ def clean_reports(
             return
     
     for report in old_reports:
-        report.unlink()
+        os.unlink(report.path)
     
     print_success(f"Deleted {len(old_reports)} reports")
 
 
 def _generate_html(data: dict) -> str:
     """Generate HTML from report data."""
-    url = data.get("url", "Unknown")
-    session = data.get("session_id", "Unknown")
+    # Raw load test samples stay in their JSONL file and are only linked
+    samples_file = data.get("samples_file")
+    samples = f'<p><a href="{escape(samples_file)}">Raw samples (JSONL)</a></p>' if samples_file else ""
     
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Perfwatch Report</title>
-    <style>
-        body {{ font-family: system-ui, sans-serif; background: #1a1a2e; color: #eee; padding: 2rem; }}
-        .container {{ max-width: 800px; margin: 0 auto; }}
-        h1 {{ color: #00d4ff; }}
-        pre {{ background: #16213e; padding: 1rem; border-radius: 8px; overflow-x: auto; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🚀 Perfwatch Report</h1>
-        <p>URL: {url} | Session: {session}</p>
-        <pre>{json.dumps(data, indent=2)}</pre>
-    </div>
-</body>
-</html>"""
+    return _HTML_TEMPLATE.substitute(
+        url=escape(str(data.get("url", "Unknown"))),
+        session=escape(str(data.get("session_id", "Unknown"))),
+        samples=samples,
+        body=escape(dumps(data), quote=False),
+    )
 
 
 def _generate_markdown(data: dict) -> str:
     """Generate Markdown from report data."""
-    url = data.get("url", "Unknown")
-    session = data.get("session_id", "Unknown")
-    
-    return f"""# Perfwatch Report
-
-**URL:** {url}  
-**Session:** {session}
-
-## Results
-
-```json
-{json.dumps(data, indent=2)}
-```
-"""
+    return _MD_TEMPLATE.substitute(
+        url=data.get("url", "Unknown"),
+        session=data.get("session_id", "Unknown"),
+        body=dumps(data),
+    )
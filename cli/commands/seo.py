@@ -3,15 +3,15 @@ SEO Command - SEO analysis.
 """
 
 import asyncio
+import os
 from datetime import datetime
-from pathlib import Path
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-from utils.validator import validate_url, normalize_url
+from utils.validator import validate_urls, normalize_url
 from utils.logger import print_header, print_success, print_error, print_warning
+from utils.paths import ensure_dir, slugify_url
+from utils.eventloop import install_fast_event_loop
 
 app = typer.Typer(help="Run SEO analysis")
 console = Console()
@@ -20,7 +20,8 @@ console = Console()
 @app.callback(invoke_without_command=True)
 def seo(
     ctx: typer.Context,
-    url: str = typer.Option(..., "--url", "-u", help="Target URL to analyze"),
+    urls: list[str] = typer.Option(..., "--url", "-u", help="Target URL to analyze (repeat to analyze several URLs)"),
+    pretty: bool = typer.Option(False, "--pretty", help="Indent the saved JSON report"),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ):
     """
@@ -29,164 +30,203 @@ def seo(
     Checks: meta tags, headings, images, links, robots.txt, sitemap
     """
     
-    # Validate URL
-    is_valid, error = validate_url(url)
-    if not is_valid:
-        print_error(f"Invalid URL: {error}")
-        raise typer.Exit(1)
+    # Validate URLs
+    targets = []
+    for url, (is_valid, error) in zip(urls, validate_urls(urls)):
+        if not is_valid:
+            print_error(f"Invalid URL: {error}")
+            raise typer.Exit(1)
+        targets.append(normalize_url(url))
     
-    url = normalize_url(url)
+    # Drop duplicates, keeping the order given
+    targets = list(dict.fromkeys(targets))
     
-    print_header("SEO Analysis", f"Target: {url}")
+    if len(targets) == 1:
+        print_header("SEO Analysis", f"Target: {targets[0]}")
+    else:
+        print_header("SEO Analysis", f"Targets: {len(targets)} URLs")
     
-    # Run analysis
-    asyncio.run(_run_seo(url, verbose))
+    # Run every analysis in a single event loop
+    install_fast_event_loop()
+    asyncio.run(_run_seo(targets, pretty, verbose))
 
 
-async def _run_seo(url: str, verbose: bool):
-    """Run SEO analysis."""
+async def _run_seo(urls: list[str], pretty: bool, verbose: bool):
+    """Run SEO analysis for all URLs concurrently, then report on each."""
     
+    import httpx
     from tools.seo import SEOTool
+    from utils.serializer import write_json
     
-    console.print("[dim]Analyzing webpage...[/dim]")
+    batch = len(urls) > 1
+    console.print("[dim]Analyzing webpages...[/dim]" if batch else "[dim]Analyzing webpage...[/dim]")
     console.print()
     
-    try:
-        tool = SEOTool()
-        result = await tool.analyze(url)
-    except Exception as e:
-        print_error(f"SEO analysis failed: {e}")
-        return
-    
-    # Display results
-    _display_results(result, verbose)
+    semaphore = asyncio.Semaphore(int(os.getenv("PERFWATCH_MAX_CONCURRENT", "4")))
     
-    # Calculate and display score
-    score = _calculate_seo_score(result)
-    _display_score(score)
+    # One client for every page so robots.txt/sitemap probes reuse connections
+    async with httpx.AsyncClient(http2=True, timeout=30.0, follow_redirects=True) as http:
+        tool = SEOTool(http=http)
+        
+        async def bounded(url: str) -> dict:
+            async with semaphore:
+                return await tool.analyze(url)
+        
+        outcomes = await asyncio.gather(*(bounded(url) for url in urls), return_exceptions=True)
     
-    # Save results
-    output_dir = Path("reports")
-    output_dir.mkdir(exist_ok=True)
+    output_dir = ensure_dir("reports")
     session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    import json
-    report_file = output_dir / f"seo_{session_id}.json"
-    result["score"] = score
-    report_file.write_text(json.dumps(result, indent=2, default=str))
-    
-    print_success(f"Report saved to: {report_file}")
+    seen: set[str] = set()
+    failed = 0
+    
+    for index, (url, result) in enumerate(zip(urls, outcomes), start=1):
+        if batch:
+            print_header("SEO Results", url)
+        
+        if isinstance(result, Exception):
+            print_error(f"SEO analysis failed: {result}")
+            failed += 1
+            continue
+        
+        # Display results
+        _display_results(result, verbose)
+        
+        # Calculate and display score
+        score = _calculate_seo_score(result)
+        _display_score(score)
+        
+        # Save results
+        slug = slugify_url(url)
+        if slug in seen:
+            slug = f"{slug}-{index}"
+        seen.add(slug)
+        
+        report_file = output_dir / f"seo_{session_id}_{slug}.json"
+        result["score"] = score
+        write_json(report_file, result, indent=pretty)
+        
+        print_success(f"Report saved to: {report_file}")
+    
+    if batch:
+        console.print()
+        console.print(f"[dim]Analyzed {len(urls) - failed}/{len(urls)} URLs successfully[/dim]")
 
 
 def _display_results(result: dict, verbose: bool):
     """Display SEO analysis results."""
     
+    # Collect every line and print once instead of one write per line
+    lines: list[str] = []
+    add = lines.append
+    
     # Meta Information
-    console.print("[bold cyan]📝 Meta Information[/bold cyan]")
-    console.print()
+    add("[bold cyan]📝 Meta Information[/bold cyan]")
+    add("")
     
     # Title
     title = result.get("title", "")
     title_len = len(title)
     if title:
         if 30 <= title_len <= 60:
-            console.print(f"  [green]✓[/green] Title: {title}")
-            console.print(f"    [dim]Length: {title_len} chars (optimal: 30-60)[/dim]")
+            add(f"  [green]✓[/green] Title: {title}")
+            add(f"    [dim]Length: {title_len} chars (optimal: 30-60)[/dim]")
         else:
-            console.print(f"  [yellow]⚠[/yellow] Title: {title}")
-            console.print(f"    [yellow]Length: {title_len} chars (optimal: 30-60)[/yellow]")
+            add(f"  [yellow]⚠[/yellow] Title: {title}")
+            add(f"    [yellow]Length: {title_len} chars (optimal: 30-60)[/yellow]")
     else:
-        console.print("  [red]✗[/red] Title: [red]Missing![/red]")
+        add("  [red]✗[/red] Title: [red]Missing![/red]")
     
     # Meta Description
     desc = result.get("meta_description", "")
     desc_len = len(desc)
     if desc:
         if 120 <= desc_len <= 160:
-            console.print(f"  [green]✓[/green] Meta Description: {desc[:80]}...")
-            console.print(f"    [dim]Length: {desc_len} chars (optimal: 120-160)[/dim]")
+            add(f"  [green]✓[/green] Meta Description: {desc[:80]}...")
+            add(f"    [dim]Length: {desc_len} chars (optimal: 120-160)[/dim]")
         else:
-            console.print(f"  [yellow]⚠[/yellow] Meta Description: {desc[:80]}...")
-            console.print(f"    [yellow]Length: {desc_len} chars (optimal: 120-160)[/yellow]")
+            add(f"  [yellow]⚠[/yellow] Meta Description: {desc[:80]}...")
+            add(f"    [yellow]Length: {desc_len} chars (optimal: 120-160)[/yellow]")
     else:
-        console.print("  [red]✗[/red] Meta Description: [red]Missing![/red]")
+        add("  [red]✗[/red] Meta Description: [red]Missing![/red]")
     
     # Canonical
     canonical = result.get("canonical", "")
     if canonical:
-        console.print(f"  [green]✓[/green] Canonical URL: {canonical}")
+        add(f"  [green]✓[/green] Canonical URL: {canonical}")
     else:
-        console.print("  [yellow]⚠[/yellow] Canonical URL: Not set")
+        add("  [yellow]⚠[/yellow] Canonical URL: Not set")
     
-    console.print()
+    add("")
     
     # Headings
-    console.print("[bold cyan]📑 Heading Structure[/bold cyan]")
-    console.print()
+    add("[bold cyan]📑 Heading Structure[/bold cyan]")
+    add("")
     
     headings = result.get("headings", {})
     h1_count = len(headings.get("h1", []))
     
     if h1_count == 1:
-        console.print(f"  [green]✓[/green] H1: {headings['h1'][0][:60]}...")
+        add(f"  [green]✓[/green] H1: {headings['h1'][0][:60]}...")
     elif h1_count == 0:
-        console.print("  [red]✗[/red] H1: [red]Missing![/red]")
+        add("  [red]✗[/red] H1: [red]Missing![/red]")
     else:
-        console.print(f"  [yellow]⚠[/yellow] H1: {h1_count} found (should be 1)")
+        add(f"  [yellow]⚠[/yellow] H1: {h1_count} found (should be 1)")
     
     for level in ["h2", "h3", "h4"]:
         count = len(headings.get(level, []))
         if count > 0:
-            console.print(f"  [dim]{level.upper()}: {count} found[/dim]")
+            add(f"  [dim]{level.upper()}: {count} found[/dim]")
     
-    console.print()
+    add("")
     
     # Images
-    console.print("[bold cyan]🖼️ Images[/bold cyan]")
-    console.print()
+    add("[bold cyan]🖼️ Images[/bold cyan]")
+    add("")
     
     images = result.get("images", {})
     total_images = images.get("total", 0)
     missing_alt = images.get("missing_alt", 0)
     
-    console.print(f"  Total images: {total_images}")
+    add(f"  Total images: {total_images}")
     if missing_alt == 0:
-        console.print(f"  [green]✓[/green] All images have alt text")
+        add(f"  [green]✓[/green] All images have alt text")
     else:
-        console.print(f"  [red]✗[/red] Missing alt text: {missing_alt} images")
+        add(f"  [red]✗[/red] Missing alt text: {missing_alt} images")
     
-    console.print()
+    add("")
     
     # Links
-    console.print("[bold cyan]🔗 Links[/bold cyan]")
-    console.print()
+    add("[bold cyan]🔗 Links[/bold cyan]")
+    add("")
     
     links = result.get("links", {})
-    console.print(f"  Internal links: {links.get('internal', 0)}")
-    console.print(f"  External links: {links.get('external', 0)}")
+    add(f"  Internal links: {links.get('internal', 0)}")
+    add(f"  External links: {links.get('external', 0)}")
     
-    console.print()
+    add("")
     
     # Technical
-    console.print("[bold cyan]⚙️ Technical SEO[/bold cyan]")
-    console.print()
+    add("[bold cyan]⚙️ Technical SEO[/bold cyan]")
+    add("")
     
     if result.get("robots_txt"):
-        console.print("  [green]✓[/green] robots.txt found")
+        add("  [green]✓[/green] robots.txt found")
     else:
-        console.print("  [yellow]⚠[/yellow] robots.txt not found")
+        add("  [yellow]⚠[/yellow] robots.txt not found")
     
     if result.get("sitemap"):
-        console.print("  [green]✓[/green] Sitemap found")
+        add("  [green]✓[/green] Sitemap found")
     else:
-        console.print("  [yellow]⚠[/yellow] Sitemap not found")
+        add("  [yellow]⚠[/yellow] Sitemap not found")
     
     if result.get("https"):
-        console.print("  [green]✓[/green] HTTPS enabled")
+        add("  [green]✓[/green] HTTPS enabled")
     else:
-        console.print("  [red]✗[/red] HTTPS not enabled")
+        add("  [red]✗[/red] HTTPS not enabled")
     
-    console.print()
+    add("")
+    
+    console.print("\n".join(lines))
 
 
 def _calculate_seo_score(result: dict) -> int:
@@ -194,52 +234,57 @@ def _calculate_seo_score(result: dict) -> int:
     score = 0
     max_score = 100
     
+    get = result.get
+    headings = get("headings", {})
+    images = get("images", {})
+    images_total = images.get("total", 0)
+    
     # Title (15 points)
-    title = result.get("title", "")
+    title = get("title", "")
     if title:
         score += 10
         if 30 <= len(title) <= 60:
             score += 5
     
     # Meta description (15 points)
-    desc = result.get("meta_description", "")
+    desc = get("meta_description", "")
     if desc:
         score += 10
         if 120 <= len(desc) <= 160:
             score += 5
     
     # Canonical (5 points)
-    if result.get("canonical"):
+    if get("canonical"):
         score += 5
     
     # H1 (15 points)
-    h1s = result.get("headings", {}).get("h1", [])
+    h1s = headings.get("h1", [])
     if len(h1s) == 1:
         score += 15
     elif len(h1s) > 1:
         score += 5
     
     # Images with alt (10 points)
-    images = result.get("images", {})
-    if images.get("total", 0) > 0:
-        if images.get("missing_alt", 0) == 0:
+    if images_total > 0:
+        missing_alt = images.get("missing_alt", 0)
+        if missing_alt == 0:
             score += 10
         else:
-            alt_ratio = 1 - (images["missing_alt"] / images["total"])
+            alt_ratio = 1 - (missing_alt / images_total)
             score += int(10 * alt_ratio)
     else:
         score += 10  # No images is not a penalty
     
     # Robots.txt (10 points)
-    if result.get("robots_txt"):
+    if get("robots_txt"):
         score += 10
     
     # Sitemap (10 points)
-    if result.get("sitemap"):
+    if get("sitemap"):
         score += 10
     
     # HTTPS (20 points)
-    if result.get("https"):
+    if get("https"):
         score += 20
     
     return min(score, max_score)
@@ -247,6 +292,7 @@ def _calculate_seo_score(result: dict) -> int:
 
 def _display_score(score: int):
     """Display SEO score with visual representation."""
+    from rich.panel import Panel
     
     if score >= 90:
         color = "green"
@@ -2,10 +2,11 @@
 Base Agent - Foundation for all agents.
 """
 
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 from enum import Enum
 
 
@@ -17,24 +18,36 @@ class AgentStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+StatusValue = Literal["idle", "running", "completed", "failed"]
+
+
+@dataclass(slots=True)
 class AgentState:
     """Agent state container."""
-    status: AgentStatus = AgentStatus.IDLE
+    # Status is kept as the AgentStatus value and timestamps as epoch
+    # seconds; their ISO form is built on first to_dict() and reused
+    status: StatusValue = AgentStatus.IDLE.value
     current_task: Optional[str] = None
     results: dict = field(default_factory=dict)
     errors: list = field(default_factory=list)
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    started_at: Optional[float] = None
+    completed_at: Optional[float] = None
+    _started_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _completed_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> dict:
+        if self._started_iso is None and self.started_at is not None:
+            self._started_iso = datetime.fromtimestamp(self.started_at).isoformat()
+        if self._completed_iso is None and self.completed_at is not None:
+            self._completed_iso = datetime.fromtimestamp(self.completed_at).isoformat()
+        
         return {
-            "status": self.status.value,
+            "status": self.status,
             "current_task": self.current_task,
             "results": self.results,
             "errors": self.errors,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "started_at": self._started_iso,
+            "completed_at": self._completed_iso,
         }
 
 
@@ -52,21 +65,24 @@ class BaseAgent(ABC):
     
     def start(self, task: str):
         """Mark agent as started."""
-        self.state.status = AgentStatus.RUNNING
+        self.state.status = AgentStatus.RUNNING.value
         self.state.current_task = task
-        self.state.started_at = datetime.now()
+        self.state.started_at = time.time()
+        self.state._started_iso = None
     
     def complete(self, results: dict):
         """Mark agent as completed."""
-        self.state.status = AgentStatus.COMPLETED
+        self.state.status = AgentStatus.COMPLETED.value
         self.state.results = results
-        self.state.completed_at = datetime.now()
+        self.state.completed_at = time.time()
+        self.state._completed_iso = None
     
     def fail(self, error: str):
         """Mark agent as failed."""
-        self.state.status = AgentStatus.FAILED
+        self.state.status = AgentStatus.FAILED.value
         self.state.errors.append(error)
-        self.state.completed_at = datetime.now()
+        self.state.completed_at = time.time()
+        self.state._completed_iso = None
     
     def get_state(self) -> dict:
         """Get current state as dict."""
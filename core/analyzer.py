@@ -2,10 +2,36 @@
 Analyzer Agent - Analyzes test results.
 """
 
+import sys
+from operator import itemgetter
 from typing import Optional
 from core.agent import BaseAgent
 
 
+# Shared severity/category values: every finding refers to the same string
+# objects, so the many small dicts built here don't hold per-entry copies
+_HIGH, _MEDIUM, _LOW = sys.intern("high"), sys.intern("medium"), sys.intern("low")
+_PERF = sys.intern("performance")
+_SEO = sys.intern("seo")
+_A11Y = sys.intern("accessibility")
+_SEC = sys.intern("security")
+_REL = sys.intern("reliability")
+
+_SEVERITY_RANK = {_HIGH: 0, _MEDIUM: 1, _LOW: 2}
+_by_rank = itemgetter("_rank")
+
+
+def _finding(severity: str, category: str, message: str, **fields) -> dict:
+    """Build an issue/warning entry carrying its sort rank."""
+    return {
+        "severity": severity,
+        "category": category,
+        **fields,
+        "message": message,
+        "_rank": _SEVERITY_RANK[severity],
+    }
+
+
 class AnalyzerAgent(BaseAgent):
     """Agent that analyzes performance test results."""
     
@@ -49,7 +75,8 @@ class AnalyzerAgent(BaseAgent):
             "overall_score": 0,
         }
         
-        scores = []
+        score_sum = 0.0
+        score_count = 0
         
         # Analyze PageSpeed results
         if "pagespeed" in results and "error" not in results["pagespeed"]:
@@ -57,27 +84,28 @@ class AnalyzerAgent(BaseAgent):
             
             if "scores" in ps:
                 for metric, score in ps["scores"].items():
-                    scores.append(score)
+                    score_sum += score
+                    score_count += 1
                     
                     if score < 50:
-                        analysis["issues"].append({
-                            "severity": "high",
-                            "category": "performance",
-                            "metric": metric,
-                            "score": score,
-                            "message": f"{metric} score is poor ({score:.0f}/100)",
-                        })
+                        analysis["issues"].append(_finding(
+                            _HIGH,
+                            _PERF,
+                            f"{metric} score is poor ({score:.0f}/100)",
+                            metric=metric,
+                            score=score,
+                        ))
                     elif score < 90:
-                        analysis["warnings"].append({
-                            "severity": "medium",
-                            "category": "performance",
-                            "metric": metric,
-                            "score": score,
-                            "message": f"{metric} needs improvement ({score:.0f}/100)",
-                        })
+                        analysis["warnings"].append(_finding(
+                            _MEDIUM,
+                            _PERF,
+                            f"{metric} needs improvement ({score:.0f}/100)",
+                            metric=metric,
+                            score=score,
+                        ))
                     else:
                         analysis["passed"].append({
-                            "category": "performance",
+                            "category": _PERF,
                             "metric": metric,
                             "score": score,
                             "message": f"{metric} is good ({score:.0f}/100)",
@@ -88,33 +116,19 @@ class AnalyzerAgent(BaseAgent):
             seo = results["seo"]
             
             if not seo.get("title"):
-                analysis["issues"].append({
-                    "severity": "high",
-                    "category": "seo",
-                    "message": "Missing page title",
-                })
+                analysis["issues"].append(_finding(_HIGH, _SEO, "Missing page title"))
             
             if not seo.get("meta_description"):
-                analysis["issues"].append({
-                    "severity": "medium",
-                    "category": "seo",
-                    "message": "Missing meta description",
-                })
+                analysis["issues"].append(_finding(_MEDIUM, _SEO, "Missing meta description"))
             
             if not seo.get("https"):
-                analysis["issues"].append({
-                    "severity": "high",
-                    "category": "security",
-                    "message": "HTTPS not enabled",
-                })
+                analysis["issues"].append(_finding(_HIGH, _SEC, "HTTPS not enabled"))
             
             images = seo.get("images", {})
             if images.get("missing_alt", 0) > 0:
-                analysis["warnings"].append({
-                    "severity": "medium",
-                    "category": "accessibility",
-                    "message": f"{images['missing_alt']} images missing alt text",
-                })
+                analysis["warnings"].append(_finding(
+                    _MEDIUM, _A11Y, f"{images['missing_alt']} images missing alt text",
+                ))
         
         # Analyze load test results
         if "loadtest" in results and "error" not in results["loadtest"]:
@@ -124,32 +138,27 @@ class AnalyzerAgent(BaseAgent):
             success_rate = lt.get("success_rate", 100)
             
             if avg_rt > 1000:
-                analysis["issues"].append({
-                    "severity": "high",
-                    "category": "performance",
-                    "message": f"Slow response time: {avg_rt:.0f}ms average",
-                })
+                analysis["issues"].append(_finding(
+                    _HIGH, _PERF, f"Slow response time: {avg_rt:.0f}ms average",
+                ))
             elif avg_rt > 500:
-                analysis["warnings"].append({
-                    "severity": "medium",
-                    "category": "performance",
-                    "message": f"Response time could be improved: {avg_rt:.0f}ms average",
-                })
+                analysis["warnings"].append(_finding(
+                    _MEDIUM, _PERF, f"Response time could be improved: {avg_rt:.0f}ms average",
+                ))
             
             if success_rate < 99:
-                analysis["issues"].append({
-                    "severity": "high",
-                    "category": "reliability",
-                    "message": f"High error rate: {100 - success_rate:.1f}% failures",
-                })
+                analysis["issues"].append(_finding(
+                    _HIGH, _REL, f"High error rate: {100 - success_rate:.1f}% failures",
+                ))
         
         # Calculate overall score
-        if scores:
-            analysis["overall_score"] = sum(scores) / len(scores)
+        if score_count:
+            analysis["overall_score"] = score_sum / score_count
         
-        # Sort issues by severity
-        severity_order = {"high": 0, "medium": 1, "low": 2}
-        analysis["issues"].sort(key=lambda x: severity_order.get(x.get("severity", "low"), 2))
-        analysis["warnings"].sort(key=lambda x: severity_order.get(x.get("severity", "low"), 2))
+        # Sort issues by severity, then drop the internal rank
+        for key in ("issues", "warnings"):
+            analysis[key].sort(key=_by_rank)
+            for entry in analysis[key]:
+                del entry["_rank"]
         
         return analysis
@@ -3,17 +3,131 @@ Load Test Tool - HTTP load/stress testing.
 """
 
 import asyncio
+import math
 import time
-import statistics
-from typing import Optional, Callable
+from contextlib import nullcontext
+from functools import partial
+from typing import Awaitable, Callable, Optional
 import httpx
 
 
+# Failed requests are still counted, but only the first few messages are kept
+MAX_REPORTED_ERRORS = 10
+
+
+def _interpolate(sorted_data: list[float], percentile: float) -> float:
+    """Percentile of sorted samples, interpolating linearly between neighbours."""
+    k = (len(sorted_data) - 1) * (percentile / 100)
+    f = int(k)
+    c = f + 1 if f + 1 < len(sorted_data) else f
+    
+    if f == c:
+        return sorted_data[f]
+    
+    return sorted_data[f] * (c - k) + sorted_data[c] * (k - f)
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram with running summary statistics.
+    
+    Memory stays constant regardless of request count. Up to EXACT_SAMPLES
+    raw samples are also kept, so small runs report percentiles exactly,
+    as linear interpolation over the sorted samples. Beyond that they are
+    estimated within one bucket (about 2.3% wide) and clamped to the
+    observed min/max.
+    """
+    
+    EXACT_SAMPLES = 1000
+    BUCKETS_PER_DECADE = 100
+    MIN_MS = 0.01
+    DECADES = 7  # 0.01 ms to 100 s; slower samples land in the last bucket
+    
+    def __init__(self):
+        self.counts = [0] * (self.BUCKETS_PER_DECADE * self.DECADES + 1)
+        self.count = 0
+        self.min = math.inf
+        self.max = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._samples: Optional[list[float]] = []
+    
+    def add(self, ms: float):
+        """Record one latency sample in milliseconds."""
+        self.count += 1
+        
+        # Welford's update keeps mean and variance numerically stable
+        delta = ms - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (ms - self._mean)
+        
+        if ms < self.min:
+            self.min = ms
+        if ms > self.max:
+            self.max = ms
+        
+        # Raw samples only until the run outgrows the exact path
+        if self._samples is not None:
+            if self.count <= self.EXACT_SAMPLES:
+                self._samples.append(ms)
+            else:
+                self._samples = None
+        
+        index = int(math.log10(ms / self.MIN_MS) * self.BUCKETS_PER_DECADE) if ms > self.MIN_MS else 0
+        self.counts[min(index, len(self.counts) - 1)] += 1
+    
+    @property
+    def mean(self) -> float:
+        return self._mean if self.count else 0
+    
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation, matching statistics.stdev."""
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0
+    
+    def percentile(self, percentile: float) -> float:
+        """Estimate a single percentile."""
+        return self.percentiles(percentile)[0]
+    
+    def percentiles(self, *percentiles: float) -> list[float]:
+        """Compute several percentiles, exactly or in one walk over the cumulative bucket counts."""
+        if not self.count:
+            return [0] * len(percentiles)
+        
+        if self._samples is not None:
+            ordered = sorted(self._samples)
+            return [_interpolate(ordered, percentile) for percentile in percentiles]
+        
+        # Visit the requested ranks in ascending order, filling results in the caller's order
+        ranks = [percentile / 100 * self.count for percentile in percentiles]
+        order = sorted(range(len(ranks)), key=ranks.__getitem__)
+        results = [self.max] * len(ranks)
+        pending = iter(order)
+        current = next(pending, None)
+        cumulative = 0
+        
+        for index, count in enumerate(self.counts):
+            if not count:
+                continue
+            while current is not None and cumulative + count >= ranks[current]:
+                # Interpolate geometrically inside the log-spaced bucket
+                fraction = (ranks[current] - cumulative) / count
+                value = self.MIN_MS * 10 ** ((index + fraction) / self.BUCKETS_PER_DECADE)
+                results[current] = min(max(value, self.min), self.max)
+                current = next(pending, None)
+            if current is None:
+                break
+            cumulative += count
+        
+        return results
+
+
 class LoadTestTool:
     """HTTP load testing tool."""
     
-    def __init__(self):
-        pass
+    def __init__(self, http: Optional[httpx.AsyncClient] = None):
+        # Optional shared client so callers can reuse one connection pool
+        self.http = http
     
     async def run(
         self,
@@ -25,6 +139,9 @@ class LoadTestTool:
         headers: Optional[dict] = None,
         body: Optional[str] = None,
         progress_callback: Optional[Callable[[int], None]] = None,
+        sample_callback: Optional[Callable[[dict], None]] = None,
+        warmup: bool = True,
+        http2: bool = False,
     ) -> dict:
         """
         Run load test against a URL.
@@ -38,81 +155,117 @@ class LoadTestTool:
             headers: Custom headers
             body: Request body for POST/PUT
             progress_callback: Callback for progress updates
+            sample_callback: Called with a dict per finished request, so raw
+                samples can be streamed out instead of kept in memory
+            warmup: Send one untimed HEAD request before the test starts
+            http2: Use HTTP/2 for this tool's own client. Workers then share
+                multiplexed streams, so `concurrent` no longer means parallel
+                connections. Ignored when a shared client was given.
         
         Returns:
             Dict with load test results
         """
         
         # Results storage
-        response_times: list[float] = []
+        latencies = LatencyHistogram()
         status_codes: dict[int, int] = {}
         errors: list[str] = []
         completed = 0
         
-        # Create semaphore for concurrency control
-        semaphore = asyncio.Semaphore(concurrent)
+        # GET and DELETE never carry a body
+        method = method.upper()
+        content = None if method in ("GET", "DELETE") else body
         
-        async def make_request(request_id: int):
+        async def make_request(send: Callable[[], Awaitable[httpx.Response]], request_id: int):
             nonlocal completed
             
-            async with semaphore:
-                start_time = time.perf_counter()
+            start_time = time.perf_counter()
+            
+            try:
+                response = await send()
                 
-                try:
-                    async with httpx.AsyncClient(timeout=timeout) as client:
-                        if method.upper() == "GET":
-                            response = await client.get(url, headers=headers)
-                        elif method.upper() == "POST":
-                            response = await client.post(url, headers=headers, content=body)
-                        elif method.upper() == "PUT":
-                            response = await client.put(url, headers=headers, content=body)
-                        elif method.upper() == "DELETE":
-                            response = await client.delete(url, headers=headers)
-                        else:
-                            response = await client.request(method, url, headers=headers, content=body)
-                        
-                        elapsed = (time.perf_counter() - start_time) * 1000  # ms
-                        response_times.append(elapsed)
-                        
-                        code = response.status_code
-                        status_codes[code] = status_codes.get(code, 0) + 1
-                        
-                except httpx.TimeoutException:
-                    errors.append(f"Request {request_id}: Timeout")
-                except httpx.ConnectError as e:
-                    errors.append(f"Request {request_id}: Connection error")
-                except Exception as e:
-                    errors.append(f"Request {request_id}: {str(e)}")
+                elapsed = (time.perf_counter() - start_time) * 1000  # ms
+                latencies.add(elapsed)
                 
-                finally:
-                    completed += 1
-                    if progress_callback:
-                        progress_callback(completed)
-        
-        # Record start time
-        test_start = time.perf_counter()
-        
-        # Create all request tasks
-        tasks = [make_request(i) for i in range(requests)]
-        
-        # Run all requests
-        await asyncio.gather(*tasks)
-        
-        # Calculate duration
-        test_duration = time.perf_counter() - test_start
+                code = response.status_code
+                status_codes[code] = status_codes.get(code, 0) + 1
+                
+                if sample_callback:
+                    sample_callback({"request": request_id, "status": code, "ms": elapsed})
+                
+            except Exception as e:
+                if isinstance(e, httpx.TimeoutException):
+                    reason = "Timeout"
+                elif isinstance(e, httpx.ConnectError):
+                    reason = "Connection error"
+                else:
+                    reason = str(e)
+                # Only a sample of errors is reported, so never store more
+                if len(errors) < MAX_REPORTED_ERRORS:
+                    errors.append(f"Request {request_id}: {reason}")
+                
+                if sample_callback:
+                    sample_callback({"request": request_id, "error": reason})
+            
+            finally:
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed)
+    
+        # One pooled client for the whole run, so connections are reused
+        async with self._client(timeout, concurrent, http2) as client:
+            if warmup:
+                # Resolve DNS and open a pooled connection outside the timed
+                # section, so handshakes don't inflate the first latencies.
+                # HEAD keeps this free of side effects for non-GET tests.
+                try:
+                    await client.head(url, headers=headers, timeout=min(timeout, 5))
+                except Exception:
+                    pass  # failures are measured and reported by the test itself
+            
+            # Record start time
+            test_start = time.perf_counter()
+            
+            # A fixed pool of workers pulls request ids from one shared
+            # iterator; a slow request only holds up its own worker, and only
+            # `concurrent` coroutines exist at any time
+            request_ids = iter(range(requests))
+            
+            # Every request is identical, so bind its arguments once
+            send = partial(client.request, method, url, headers=headers, content=content, timeout=timeout)
+            
+            async def worker():
+                for request_id in request_ids:
+                    await make_request(send, request_id)
+            
+            await asyncio.gather(*(worker() for _ in range(min(concurrent, requests))))
+            
+            # Calculate duration
+            test_duration = time.perf_counter() - test_start
         
         # Calculate statistics
         return self._calculate_stats(
-            response_times=response_times,
+            latencies=latencies,
             status_codes=status_codes,
             errors=errors,
             total_requests=requests,
             duration=test_duration,
         )
     
+    def _client(self, timeout: int, concurrent: int, http2: bool = False):
+        """Use the shared client if one was given, otherwise one sized for this run."""
+        if self.http is not None:
+            return nullcontext(self.http)
+        # HTTP/1.1 by default: one connection per worker is the load users expect
+        return httpx.AsyncClient(
+            timeout=timeout,
+            http2=http2,
+            limits=httpx.Limits(max_connections=concurrent, max_keepalive_connections=concurrent),
+        )
+    
     def _calculate_stats(
         self,
-        response_times: list[float],
+        latencies: LatencyHistogram,
         status_codes: dict[int, int],
         errors: list[str],
         total_requests: int,
@@ -120,7 +273,7 @@ class LoadTestTool:
     ) -> dict:
         """Calculate load test statistics."""
         
-        successful = len(response_times)
+        successful = latencies.count
         failed = total_requests - successful
         
         result = {
@@ -129,22 +282,21 @@ class LoadTestTool:
             "failed": failed,
             "success_rate": (successful / total_requests * 100) if total_requests > 0 else 0,
             "status_codes": status_codes,
-            "errors": errors[:10],  # Limit errors to first 10
+            "errors": errors,
             "duration": duration,
             "rps": total_requests / duration if duration > 0 else 0,
         }
         
-        if response_times:
-            sorted_times = sorted(response_times)
-            
+        if successful:
+            median, p95, p99 = latencies.percentiles(50, 95, 99)
             result.update({
-                "avg_response_time": statistics.mean(response_times),
-                "min_response_time": min(response_times),
-                "max_response_time": max(response_times),
-                "median_response_time": statistics.median(response_times),
-                "stdev_response_time": statistics.stdev(response_times) if len(response_times) > 1 else 0,
-                "p95_response_time": self._percentile(sorted_times, 95),
-                "p99_response_time": self._percentile(sorted_times, 99),
+                "avg_response_time": latencies.mean,
+                "min_response_time": latencies.min,
+                "max_response_time": latencies.max,
+                "median_response_time": median,
+                "stdev_response_time": latencies.stdev,
+                "p95_response_time": p95,
+                "p99_response_time": p99,
             })
         else:
             result.update({
@@ -158,17 +310,3 @@ class LoadTestTool:
             })
         
         return result
-    
-    def _percentile(self, sorted_data: list[float], percentile: int) -> float:
-        """Calculate percentile from sorted data."""
-        if not sorted_data:
-            return 0
-        
-        k = (len(sorted_data) - 1) * (percentile / 100)
-        f = int(k)
-        c = f + 1 if f + 1 < len(sorted_data) else f
-        
-        if f == c:
-            return sorted_data[f]
-        
-        return sorted_data[f] * (c - k) + sorted_data[c] * (k - f)
@@ -2,22 +2,81 @@
 PageSpeed Tool - Google PageSpeed Insights API integration.
 """
 
+import copy
 import os
+import time
+from contextlib import nullcontext
+from operator import itemgetter
 import httpx
 from typing import Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Parsed results per (url, strategy, categories), so repeated analyses of the
+# same page within one process skip the multi-second API call. Set
+# PERFWATCH_PAGESPEED_CACHE_TTL=0 to disable.
+_CACHE_MAXSIZE = 128
+_cache: dict[tuple, tuple[float, dict]] = {}
+
+
+# Lighthouse audit id -> display name for the Core Web Vitals
+VITALS_MAP = {
+    "largest-contentful-paint": "LCP",
+    "first-input-delay": "FID",
+    "cumulative-layout-shift": "CLS",
+    "first-contentful-paint": "FCP",
+    "speed-index": "Speed Index",
+    "total-blocking-time": "TBT",
+    "interactive": "Time to Interactive",
+}
+
+# Audits reported as improvement opportunities when not scoring 100%
+OPPORTUNITY_AUDITS = (
+    "render-blocking-resources",
+    "unused-css-rules",
+    "unused-javascript",
+    "modern-image-formats",
+    "uses-optimized-images",
+    "uses-responsive-images",
+    "efficient-animated-content",
+    "uses-text-compression",
+    "uses-rel-preconnect",
+    "server-response-time",
+    "redirects",
+    "uses-rel-preload",
+    "offscreen-images",
+)
+
+
+def _cache_ttl() -> float:
+    return float(os.getenv("PERFWATCH_PAGESPEED_CACHE_TTL", "3600"))
+
 
 class PageSpeedTool:
     """Google PageSpeed Insights API wrapper."""
     
     API_URL = "https://www.googleapis.com/pagespeedonline/v5/runPagespeed"
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, http: Optional[httpx.AsyncClient] = None):
         # Only use PAGESPEED_API_KEY, not GOOGLE_API_KEY (Gemini key doesn't work for PageSpeed)
         self.api_key = api_key or os.getenv("PAGESPEED_API_KEY")
+        # Optional shared client so callers can reuse one connection pool
+        self.http = http
+        # Pooled client created on first use when no shared one was given
+        self._own_http: Optional[httpx.AsyncClient] = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the client this tool created for itself, if any."""
+        if self._own_http is not None:
+            await self._own_http.aclose()
+            self._own_http = None
     
     async def analyze(
         self, 
@@ -40,6 +99,13 @@ class PageSpeedTool:
         if categories is None:
             categories = ["performance", "accessibility", "best-practices", "seo"]
         
+        ttl = _cache_ttl()
+        cache_key = (url, strategy, tuple(sorted(categories)))
+        entry = _cache.get(cache_key) if ttl > 0 else None
+        if entry is not None and entry[0] > time.monotonic():
+            # Callers may annotate the result, so never hand out the cached dict
+            return copy.deepcopy(entry[1])
+        
         # Build URL with multiple category params
         category_params = "&".join([f"category={cat}" for cat in categories])
         request_url = f"{self.API_URL}?url={url}&strategy={strategy}&{category_params}"
@@ -49,13 +115,35 @@ class PageSpeedTool:
             request_url += f"&key={self.api_key}"
         
         # Make request
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(request_url)
+        async with self._client() as client:
+            response = await client.get(request_url, timeout=60.0)
             response.raise_for_status()
             data = response.json()
         
         # Parse response
-        return self._parse_response(data)
+        result = self._parse_response(data)
+        
+        if ttl > 0:
+            _cache.pop(cache_key, None)
+            if len(_cache) >= _CACHE_MAXSIZE:
+                # Dicts keep insertion order, so the first key is the oldest
+                del _cache[next(iter(_cache))]
+            _cache[cache_key] = (time.monotonic() + ttl, copy.deepcopy(result))
+        
+        return result
+    
+    def _client(self):
+        """Use the shared client if one was given, otherwise this tool's own pooled client."""
+        if self.http is not None:
+            return nullcontext(self.http)
+        if self._own_http is None:
+            # HTTP/2 and keepalive let repeated calls on this instance share a connection
+            self._own_http = httpx.AsyncClient(
+                http2=True,
+                timeout=60.0,
+                limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30),
+            )
+        return nullcontext(self._own_http)
     
     def _parse_response(self, data: dict) -> dict:
         """Parse PageSpeed API response."""
@@ -80,17 +168,7 @@ class PageSpeedTool:
         audits = lighthouse.get("audits", {})
         result["web_vitals"] = {}
         
-        vitals_map = {
-            "largest-contentful-paint": "LCP",
-            "first-input-delay": "FID",
-            "cumulative-layout-shift": "CLS",
-            "first-contentful-paint": "FCP",
-            "speed-index": "Speed Index",
-            "total-blocking-time": "TBT",
-            "interactive": "Time to Interactive",
-        }
-        
-        for audit_id, display_name in vitals_map.items():
+        for audit_id, display_name in VITALS_MAP.items():
             if audit_id in audits:
                 audit = audits[audit_id]
                 result["web_vitals"][display_name] = {
@@ -100,25 +178,9 @@ class PageSpeedTool:
                 }
         
         # Extract opportunities
-        result["opportunities"] = []
-        
-        opportunity_audits = [
-            "render-blocking-resources",
-            "unused-css-rules",
-            "unused-javascript",
-            "modern-image-formats",
-            "uses-optimized-images",
-            "uses-responsive-images",
-            "efficient-animated-content",
-            "uses-text-compression",
-            "uses-rel-preconnect",
-            "server-response-time",
-            "redirects",
-            "uses-rel-preload",
-            "offscreen-images",
-        ]
-        
-        for audit_id in opportunity_audits:
+        ranked = []
+        
+        for audit_id in OPPORTUNITY_AUDITS:
             if audit_id in audits:
                 audit = audits[audit_id]
                 if audit.get("score", 1) < 1:  # Not perfect score
@@ -128,20 +190,20 @@ class PageSpeedTool:
                         "description": audit.get("description", ""),
                     }
                     
-                    # Get potential savings
+                    # Get potential savings, keeping the number for sorting
                     details = audit.get("details", {})
+                    savings = 0
                     if "overallSavingsMs" in details:
-                        opportunity["savings"] = f"{details['overallSavingsMs']:.0f}ms"
+                        savings = details["overallSavingsMs"]
+                        opportunity["savings"] = f"{savings:.0f}ms"
                     elif "overallSavingsBytes" in details:
-                        kb = details["overallSavingsBytes"] / 1024
-                        opportunity["savings"] = f"{kb:.1f} KB"
+                        savings = details["overallSavingsBytes"] / 1024
+                        opportunity["savings"] = f"{savings:.1f} KB"
                     
-                    result["opportunities"].append(opportunity)
+                    ranked.append((savings, opportunity))
         
         # Sort opportunities by potential savings
-        result["opportunities"].sort(
-            key=lambda x: float(x.get("savings", "0").replace("ms", "").replace(" KB", "").replace(",", "") or 0),
-            reverse=True
-        )
+        ranked.sort(key=itemgetter(0), reverse=True)
+        result["opportunities"] = [opportunity for _, opportunity in ranked]
         
         return result
@@ -2,17 +2,72 @@
 SEO Tool - SEO analysis.
 """
 
+import asyncio
+import time
+from contextlib import nullcontext
 import httpx
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, urljoin
 from typing import Optional
 
+try:
+    import lxml  # noqa: F401
+    _PARSER = "lxml"
+except ImportError:  # lxml is a declared dependency; fall back if it is missing
+    _PARSER = "html.parser"
+
+
+# Seconds to reuse a site's robots.txt/sitemap probe results
+SITE_CACHE_TTL = 300
+
+_HEADINGS = ("h1", "h2", "h3", "h4", "h5", "h6")
+
+
+def _is_internal(href: str, base_url: str, base_netloc: str, base_prefixes: tuple[str, str]) -> bool:
+    """Check whether a link stays on the base host, without parsing it when a prefix decides."""
+    # urlsplit drops tabs and newlines anywhere in a URL, so leave those to it
+    if href.isprintable():
+        # Root-relative paths always resolve to the base host ("//" is protocol-relative)
+        if href.startswith("/") and not href.startswith("//"):
+            return True
+        
+        # Absolute links to the base host, as long as the host name ends there
+        for prefix in base_prefixes:
+            if href.startswith(prefix):
+                rest = href[len(prefix):]
+                if not rest or rest[0] in "/?#":
+                    return True
+                break
+    
+    # Anything else (relative paths, other hosts, odd schemes) is resolved fully
+    return urlparse(urljoin(base_url, href)).netloc == base_netloc
+
 
 class SEOTool:
     """SEO analysis tool."""
     
-    def __init__(self):
-        pass
+    # robots.txt/sitemap outcomes per base URL, shared by every instance so
+    # pages on the same site within one run only probe it once
+    _site_cache: dict[str, tuple[float, tuple[bool, bool]]] = {}
+    _site_pending: dict[str, asyncio.Future] = {}
+    
+    def __init__(self, http: Optional[httpx.AsyncClient] = None):
+        # Optional shared client so callers can reuse one connection pool
+        self.http = http
+        # Pooled client created on first use when no shared one was given
+        self._own_http: Optional[httpx.AsyncClient] = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the client this tool created for itself, if any."""
+        if self._own_http is not None:
+            await self._own_http.aclose()
+            self._own_http = None
     
     async def analyze(self, url: str) -> dict:
         """
@@ -32,172 +87,195 @@ class SEOTool:
             "https": parsed_url.scheme == "https",
         }
         
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            # Fetch main page
-            response = await client.get(url)
-            html = response.text
-            
-            # Parse HTML
-            soup = BeautifulSoup(html, "html.parser")
-            
-            # Extract meta information
-            result.update(self._extract_meta(soup))
-            
-            # Extract headings
-            result["headings"] = self._extract_headings(soup)
-            
-            # Extract images
-            result["images"] = self._extract_images(soup)
-            
-            # Extract links
-            result["links"] = self._extract_links(soup, base_url)
-            
-            # Check robots.txt
-            result["robots_txt"] = await self._check_robots(client, base_url)
+        async with self._client() as client:
+            # The page and the site-wide robots.txt/sitemap probes are
+            # independent, so start the probes before fetching the page
+            site_probe = asyncio.ensure_future(self._check_site(client, base_url))
+            try:
+                response = await client.get(url, follow_redirects=True)
+            except BaseException:
+                site_probe.cancel()
+                raise
             
-            # Check sitemap
-            result["sitemap"] = await self._check_sitemap(client, base_url)
-        
-        return result
-    
-    def _extract_meta(self, soup: BeautifulSoup) -> dict:
-        """Extract meta tags."""
-        result = {}
-        
-        # Title
-        title_tag = soup.find("title")
-        result["title"] = title_tag.get_text().strip() if title_tag else ""
-        
-        # Meta description
-        meta_desc = soup.find("meta", attrs={"name": "description"})
-        result["meta_description"] = meta_desc.get("content", "").strip() if meta_desc else ""
-        
-        # Canonical
-        canonical = soup.find("link", rel="canonical")
-        result["canonical"] = canonical.get("href", "") if canonical else ""
-        
-        # Viewport
-        viewport = soup.find("meta", attrs={"name": "viewport"})
-        result["has_viewport"] = viewport is not None
+            # Links and site files belong to wherever the page finally came
+            # from, which differs from the requested origin after a redirect.
+            # The requested origin's probe is then stale, so probe the final
+            # one right away instead of waiting for it first.
+            final_base = str(response.url.copy_with(path="", query=None, fragment=None))
+            if final_base != base_url:
+                site_probe.cancel()
+                base_url = final_base
+                site = await self._check_site(client, base_url)
+            else:
+                site = await site_probe
         
-        # Language
-        html_tag = soup.find("html")
-        result["language"] = html_tag.get("lang", "") if html_tag else ""
+        # Parse the raw bytes so the body is decoded once, by the parser; a
+        # charset from the Content-Type header still takes precedence
+        soup = BeautifulSoup(response.content, _PARSER, from_encoding=response.charset_encoding)
         
-        # Open Graph
-        og_tags = {}
-        for og in soup.find_all("meta", property=lambda x: x and x.startswith("og:")):
-            prop = og.get("property", "").replace("og:", "")
-            og_tags[prop] = og.get("content", "")
-        result["open_graph"] = og_tags
+        # Extract meta tags, headings, images and links
+        result.update(self._extract_all(soup, base_url))
         
-        # Twitter Cards
-        twitter_tags = {}
-        for tw in soup.find_all("meta", attrs={"name": lambda x: x and x.startswith("twitter:")}):
-            prop = tw.get("name", "").replace("twitter:", "")
-            twitter_tags[prop] = tw.get("content", "")
-        result["twitter_cards"] = twitter_tags
+        # Check robots.txt and sitemap
+        result["robots_txt"], result["sitemap"] = site
         
         return result
     
-    def _extract_headings(self, soup: BeautifulSoup) -> dict:
-        """Extract heading structure."""
-        headings = {}
-        
-        for level in ["h1", "h2", "h3", "h4", "h5", "h6"]:
-            tags = soup.find_all(level)
-            headings[level] = [tag.get_text().strip() for tag in tags]
+    async def _check_site(self, client: httpx.AsyncClient, base_url: str) -> tuple[bool, bool]:
+        """Return (robots_txt, sitemap) for a site, probing it at most once per TTL."""
+        cached = SEOTool._site_cache.get(base_url)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
         
-        return headings
+        # Concurrent analyses of pages on one site share a single in-flight probe
+        task = SEOTool._site_pending.get(base_url)
+        if task is None:
+            task = asyncio.ensure_future(self._probe_site(client, base_url))
+            SEOTool._site_pending[base_url] = task
+            task.add_done_callback(lambda _: SEOTool._site_pending.pop(base_url, None))
+        # Shielded so a caller that stops waiting doesn't cancel the probe for the others
+        return await asyncio.shield(task)
     
-    def _extract_images(self, soup: BeautifulSoup) -> dict:
-        """Extract image information."""
-        images = soup.find_all("img")
-        
-        total = len(images)
-        missing_alt = 0
-        missing_src = 0
+    async def _probe_site(self, client: httpx.AsyncClient, base_url: str) -> tuple[bool, bool]:
+        """Fetch robots.txt and the sitemap candidates concurrently and cache the outcome."""
+        sitemap_urls = [
+            f"{base_url}/sitemap.xml",
+            f"{base_url}/sitemap_index.xml",
+            f"{base_url}/sitemap.xml.gz",
+        ]
+        robots_response, *sitemap_responses = await asyncio.gather(
+            client.get(f"{base_url}/robots.txt", follow_redirects=True),
+            *(client.get(sitemap_url, follow_redirects=True) for sitemap_url in sitemap_urls),
+            return_exceptions=True,
+        )
         
-        for img in images:
-            if not img.get("alt"):
-                missing_alt += 1
-            if not img.get("src"):
-                missing_src += 1
+        # robots.txt body is read once and shared by both checks
+        robots_txt = self._robots_text(robots_response)
+        site = (robots_txt is not None, self._check_sitemap(sitemap_responses, robots_txt))
         
-        return {
-            "total": total,
-            "missing_alt": missing_alt,
-            "missing_src": missing_src,
-        }
+        SEOTool._site_cache[base_url] = (time.monotonic() + SITE_CACHE_TTL, site)
+        return site
     
-    def _extract_links(self, soup: BeautifulSoup, base_url: str) -> dict:
-        """Extract link information."""
-        links = soup.find_all("a", href=True)
-        
-        internal = 0
-        external = 0
-        nofollow = 0
+    def _client(self):
+        """Use the shared client if one was given, otherwise this tool's own pooled client."""
+        if self.http is not None:
+            return nullcontext(self.http)
+        if self._own_http is None:
+            # HTTP/2 and keepalive let repeated calls on this instance share a connection
+            self._own_http = httpx.AsyncClient(
+                http2=True,
+                timeout=30.0,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30),
+            )
+        return nullcontext(self._own_http)
+    
+    def _extract_all(self, soup: BeautifulSoup, base_url: str) -> dict:
+        """Extract meta tags, headings, images and links in one pass over the tree."""
+        title = meta_description = canonical = language = None
+        has_viewport = False
+        og_tags = {}
+        twitter_tags = {}
+        headings = {level: [] for level in _HEADINGS}
+        images_total = missing_alt = missing_src = 0
+        internal = external = nofollow = 0
         
-        parsed_base = urlparse(base_url)
+        base_netloc = urlparse(base_url).netloc
+        base_prefixes = (f"https://{base_netloc}", f"http://{base_netloc}")
         
-        for link in links:
-            href = link.get("href", "")
+        for tag in soup.find_all(True):
+            name = tag.name
             
-            # Skip anchors and javascript
-            if href.startswith("#") or href.startswith("javascript:"):
-                continue
+            if name == "a":
+                href = tag.get("href")
+                
+                # Skip missing hrefs, anchors and javascript
+                if href is None or href.startswith(("#", "javascript:")):
+                    continue
+                
+                if _is_internal(href, base_url, base_netloc, base_prefixes):
+                    internal += 1
+                else:
+                    external += 1
+                
+                # Check nofollow
+                if "nofollow" in tag.get("rel", []):
+                    nofollow += 1
             
-            # Make absolute
-            absolute_url = urljoin(base_url, href)
-            parsed_link = urlparse(absolute_url)
+            elif name == "img":
+                images_total += 1
+                if not tag.get("alt"):
+                    missing_alt += 1
+                if not tag.get("src"):
+                    missing_src += 1
             
-            if parsed_link.netloc == parsed_base.netloc:
-                internal += 1
-            else:
-                external += 1
+            elif name in headings:
+                headings[name].append(tag.get_text().strip())
             
-            # Check nofollow
-            rel = link.get("rel", [])
-            if "nofollow" in rel:
-                nofollow += 1
+            elif name == "meta":
+                # Open Graph and Twitter Cards are matched by prefix right here;
+                # soup.select() would not help, as soupsieve matches in Python
+                # and would walk the whole tree again for every selector
+                prop = tag.get("property")
+                if prop and prop.startswith("og:"):
+                    og_tags[prop.replace("og:", "")] = tag.get("content", "")
+                
+                meta_name = tag.get("name")
+                if not meta_name:
+                    continue
+                if meta_name.startswith("twitter:"):
+                    twitter_tags[meta_name.replace("twitter:", "")] = tag.get("content", "")
+                elif meta_name == "description":
+                    if meta_description is None:
+                        meta_description = tag.get("content", "").strip()
+                elif meta_name == "viewport":
+                    has_viewport = True
+            
+            elif name == "link":
+                if canonical is None and "canonical" in tag.get("rel", []):
+                    canonical = tag.get("href", "")
+            
+            elif name == "title":
+                if title is None:
+                    title = tag.get_text().strip()
+            
+            elif name == "html":
+                if language is None:
+                    language = tag.get("lang", "")
         
         return {
-            "internal": internal,
-            "external": external,
-            "nofollow": nofollow,
-            "total": internal + external,
+            "title": title or "",
+            "meta_description": meta_description or "",
+            "canonical": canonical or "",
+            "has_viewport": has_viewport,
+            "language": language or "",
+            "open_graph": og_tags,
+            "twitter_cards": twitter_tags,
+            "headings": headings,
+            "images": {
+                "total": images_total,
+                "missing_alt": missing_alt,
+                "missing_src": missing_src,
+            },
+            "links": {
+                "internal": internal,
+                "external": external,
+                "nofollow": nofollow,
+                "total": internal + external,
+            },
         }
     
-    async def _check_robots(self, client: httpx.AsyncClient, base_url: str) -> bool:
-        """Check if robots.txt exists."""
-        try:
-            response = await client.get(f"{base_url}/robots.txt")
-            return response.status_code == 200 and len(response.text) > 0
-        except:
-            return False
+    def _robots_text(self, response) -> Optional[str]:
+        """Return the robots.txt body, or None if it is missing or empty."""
+        if isinstance(response, BaseException) or response.status_code != 200:
+            return None
+        return response.text or None
     
-    async def _check_sitemap(self, client: httpx.AsyncClient, base_url: str) -> bool:
+    def _check_sitemap(self, responses: list, robots_txt: Optional[str]) -> bool:
         """Check if sitemap exists."""
-        sitemap_urls = [
-            f"{base_url}/sitemap.xml",
-            f"{base_url}/sitemap_index.xml",
-            f"{base_url}/sitemap.xml.gz",
-        ]
-        
-        for sitemap_url in sitemap_urls:
-            try:
-                response = await client.get(sitemap_url)
-                if response.status_code == 200:
-                    return True
-            except:
-                continue
-        
-        # Also check robots.txt for sitemap directive
-        try:
-            response = await client.get(f"{base_url}/robots.txt")
-            if response.status_code == 200 and "sitemap:" in response.text.lower():
+        for response in responses:
+            if not isinstance(response, BaseException) and response.status_code == 200:
                 return True
-        except:
-            pass
         
-        return False
+        # Also check robots.txt for sitemap directive
+        return robots_txt is not None and "sitemap:" in robots_txt.lower()
@@ -14,8 +14,10 @@ from utils.logger import (
     print_metrics_table,
     format_timestamp,
     format_duration,
+    flush_console,
 )
-from utils.validator import validate_url, validate_domain, normalize_url
+from utils.validator import validate, validate_url, validate_urls, validate_domain, normalize_url
+from utils.scoring import classify_score
 
 __all__ = [
     "console",
@@ -31,7 +33,11 @@ __all__ = [
     "print_metrics_table",
     "format_timestamp",
     "format_duration",
+    "flush_console",
+    "validate",
     "validate_url",
+    "validate_urls",
     "validate_domain",
     "normalize_url",
+    "classify_score",
 ]
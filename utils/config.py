@@ -2,101 +2,239 @@
 Config Loader - Load settings from YAML configuration file.
 """
 
+import logging
+import marshal
 import os
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, Optional
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+def _accessor(name: str):
+    """Build a legacy get_<name>() method that reads the matching property."""
+    return lambda self: getattr(self, name)
+
 
 class Config:
     """Configuration manager for Perfwatch."""
     
-    _instance = None
-    _config = None
-    
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-    
-    def __init__(self):
-        if self._config is None:
-            self._load_config()
-    
-    def _load_config(self):
-        """Load configuration from YAML file."""
-        config_paths = [
-            Path("config/settings.yaml"),
-            Path("settings.yaml"),
-            Path.home() / ".perfwatch" / "settings.yaml",
-        ]
-        
-        for path in config_paths:
-            if path.exists():
-                with open(path, "r", encoding="utf-8") as f:
-                    self._config = yaml.safe_load(f) or {}
-                return
-        
-        # Default config if no file found
-        self._config = {}
-    
     def get(self, key: str, default: Any = None) -> Any:
         """
         Get a config value using dot notation.
         
         Example: config.get("loadtest.requests", 100)
         """
-        keys = key.split(".")
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
-            
-            if value is None:
-                return default
+        value = _load_settings().get(key)
+        return default if value is None else value
+    
+    def reload(self):
+        """
+        Re-read settings on the next lookup, picking up edited files.
         
-        return value
+        Unchanged files are served from the in-process parse cache.
+        """
+        _load_settings.cache_clear()
+        # Drop this instance's cached accessor values so they are recomputed
+        for name, attr in vars(type(self)).items():
+            if isinstance(attr, cached_property):
+                self.__dict__.pop(name, None)
     
-    def get_ai_model(self) -> str:
+    @cached_property
+    def ai_model(self) -> str:
         """Get AI model name."""
         return self.get("ai.model", "gemini-2.5-flash")
     
-    def get_ai_temperature(self) -> float:
+    @cached_property
+    def ai_temperature(self) -> float:
         """Get AI temperature."""
         return self.get("ai.temperature", 0.3)
     
-    def get_loadtest_requests(self) -> int:
+    @cached_property
+    def ai_cache_ttl(self) -> int:
+        """Get AI response cache TTL in seconds."""
+        return self.get("ai.cache_ttl", 86400)
+    
+    @cached_property
+    def ai_semantic_cache_enabled(self) -> bool:
+        """Get whether similar prompts may reuse cached AI responses."""
+        return self.get("ai.semantic_cache.enabled", False)
+    
+    @cached_property
+    def ai_semantic_cache_threshold(self) -> float:
+        """Get minimum cosine similarity for a semantic cache hit."""
+        return self.get("ai.semantic_cache.threshold", 0.92)
+    
+    @cached_property
+    def ai_semantic_cache_ttl(self) -> int:
+        """Get semantic cache TTL in seconds."""
+        return self.get("ai.semantic_cache.ttl", self.ai_cache_ttl)
+    
+    @cached_property
+    def loadtest_requests(self) -> int:
         """Get default load test requests."""
         return self.get("loadtest.requests", 100)
     
-    def get_loadtest_concurrent(self) -> int:
+    @cached_property
+    def loadtest_concurrent(self) -> int:
         """Get default load test concurrent connections."""
         return self.get("loadtest.concurrent", 10)
     
-    def get_loadtest_timeout(self) -> int:
+    @cached_property
+    def loadtest_timeout(self) -> int:
         """Get default load test timeout."""
         return self.get("loadtest.timeout", 30)
     
-    def get_pagespeed_strategy(self) -> str:
+    @cached_property
+    def pagespeed_strategy(self) -> str:
         """Get PageSpeed strategy (mobile/desktop)."""
         return self.get("pagespeed.strategy", "mobile")
     
-    def get_pagespeed_categories(self) -> list:
+    @cached_property
+    def pagespeed_categories(self) -> list:
         """Get PageSpeed categories."""
         return self.get("pagespeed.categories", [
             "performance", "accessibility", "best-practices", "seo"
         ])
     
-    def get_reports_dir(self) -> str:
+    @cached_property
+    def reports_dir(self) -> str:
         """Get reports output directory."""
         return self.get("reports.output_dir", "reports")
     
-    def get_reports_format(self) -> str:
+    @cached_property
+    def reports_format(self) -> str:
         """Get default report format."""
         return self.get("reports.default_format", "html")
+    
+    # Method-style names used before the accessors became cached properties
+    get_ai_model = _accessor("ai_model")
+    get_ai_temperature = _accessor("ai_temperature")
+    get_ai_cache_ttl = _accessor("ai_cache_ttl")
+    get_ai_semantic_cache_enabled = _accessor("ai_semantic_cache_enabled")
+    get_ai_semantic_cache_threshold = _accessor("ai_semantic_cache_threshold")
+    get_ai_semantic_cache_ttl = _accessor("ai_semantic_cache_ttl")
+    get_loadtest_requests = _accessor("loadtest_requests")
+    get_loadtest_concurrent = _accessor("loadtest_concurrent")
+    get_loadtest_timeout = _accessor("loadtest_timeout")
+    get_pagespeed_strategy = _accessor("pagespeed_strategy")
+    get_pagespeed_categories = _accessor("pagespeed_categories")
+    get_reports_dir = _accessor("reports_dir")
+    get_reports_format = _accessor("reports_format")
+
+
+@lru_cache(maxsize=1)
+def _load_settings() -> dict:
+    """
+    Load the first settings file found, keyed by every dotted path.
+    
+    Cached so the files are read once per process, on the first lookup,
+    which keeps paths like `--help` from touching them at all.
+    """
+    config_paths = [
+        Path("config/settings.yaml"),
+        Path("settings.yaml"),
+        Path.home() / ".perfwatch" / "settings.yaml",
+    ]
+    
+    settings = {}
+    for path in config_paths:
+        if path.exists():
+            settings = _load_yaml_cached(path)
+            break
+    
+    # Every dotted path, including intermediate sections, for one-lookup get()
+    return _flatten(settings)
+
+
+def _flatten(tree: Any, prefix: str = "", flat: Optional[dict] = None) -> dict:
+    """Map every dotted key path in a nested config dict to its value."""
+    if flat is None:
+        flat = {}
+    if isinstance(tree, dict):
+        for key, value in tree.items():
+            # Only string keys without dots can be addressed by get()
+            if isinstance(key, str) and "." not in key:
+                path = prefix + key
+                flat[path] = value
+                _flatten(value, path + ".", flat)
+    return flat
+
+
+# Parsed settings files keyed by (path, mtime_ns, size), most recent last
+_PARSED_MAXSIZE = 8
+_parsed: "OrderedDict[tuple[str, int, int], dict]" = OrderedDict()
+
+
+@lru_cache(maxsize=1)
+def _warn_pure_python_yaml():
+    """Warn once that settings are parsed without the libyaml C loader."""
+    logging.getLogger("perfwatch").warning(
+        "PyYAML has no libyaml support; settings are parsed with the slower pure-Python loader"
+    )
+
+
+def _load_yaml_cached(path: Path) -> dict:
+    """
+    Load a YAML settings file through a binary cache stored next to it.
+    
+    The cache records the source file's mtime and size and is rebuilt when
+    either changes. marshal is used rather than pickle because loading it
+    cannot run code, so the cache is no more trusted than the YAML itself.
+    """
+    cache_path = path.with_suffix(path.suffix + ".cache")
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    
+    # Reloads of an unchanged file within this process skip the disk cache too
+    key = (str(path),) + stamp
+    data = _parsed.get(key)
+    if data is not None:
+        _parsed.move_to_end(key)
+        return data
+    
+    data = _read_yaml_cache(cache_path, stamp)
+    if data is None:
+        data = _parse_yaml(path, cache_path, stamp)
+    
+    _parsed[key] = data
+    if len(_parsed) > _PARSED_MAXSIZE:
+        _parsed.popitem(last=False)
+    return data
+
+
+def _read_yaml_cache(cache_path: Path, stamp: tuple[int, int]) -> Optional[dict]:
+    """Return the marshalled settings if the cache matches the source stamp."""
+    try:
+        cached_stamp, data = marshal.loads(cache_path.read_bytes())
+        if cached_stamp == stamp:
+            return data
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    return None
+
+
+def _parse_yaml(path: Path, cache_path: Path, stamp: tuple[int, int]) -> dict:
+    """Parse a YAML settings file and refresh its binary cache."""
+    if _YamlLoader is yaml.SafeLoader:
+        _warn_pure_python_yaml()
+    
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader) or {}
+    
+    # Read-only config dirs, or values marshal can't store (e.g. dates), just skip the cache
+    try:
+        cache_path.write_bytes(marshal.dumps((stamp, data)))
+    except (OSError, ValueError):
+        pass
+    
+    return data
 
 
 # Global config instance
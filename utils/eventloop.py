@@ -0,0 +1,24 @@
+"""
+Perfwatch Event Loop - Optional uvloop acceleration for asyncio entry points.
+"""
+
+import asyncio
+import sys
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional: pip install perfwatch[fast]
+    uvloop = None
+
+
+def install_fast_event_loop() -> bool:
+    """
+    Use uvloop for subsequent asyncio.run() calls when it is available.
+    
+    Returns True if uvloop was installed, False if the stock loop is kept.
+    """
+    if uvloop is None or sys.platform == "win32":
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
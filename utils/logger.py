@@ -2,28 +2,109 @@
 Perfwatch Logger - Rich-based logging utilities.
 """
 
+import atexit
 import logging
-from typing import Optional
+import os
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Optional
 from datetime import datetime
 from rich.console import Console
-from rich.logging import RichHandler
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-from rich.table import Table
+
+from utils.scoring import SCORE_TIERS, classify_score
+
+# Heavier rich modules are imported where used so `--help` stays fast
+if TYPE_CHECKING:
+    from rich.progress import Progress
 
 
 console = Console()
 
+# Opt-in: status lines are queued and written in batches by a background
+# thread. Off by default because other consoles write to stdout directly
+# and could interleave with lines still in the queue.
+_BUFFERED = os.getenv("PERFWATCH_CONSOLE_BUFFER", "0") == "1"
+_BATCH_WINDOW = 0.01  # seconds to keep collecting lines after the first
+_BATCH_SIZE = 256
+
+_line_queue: "queue.SimpleQueue[str | threading.Event]" = queue.SimpleQueue()
+_writer: Optional[threading.Thread] = None
+_writer_lock = threading.Lock()
+
+
+def _write_batches():
+    """Background loop joining queued lines into one console write per batch."""
+    while True:
+        item = _line_queue.get()
+        batch: list[str] = []
+        waiters: list[threading.Event] = []
+        deadline = time.monotonic() + _BATCH_WINDOW
+        
+        # Keep collecting until the window closes, the batch is full, or a
+        # flush_console() marker asks for everything queued before it
+        while True:
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+                break
+            batch.append(item)
+            remaining = deadline - time.monotonic()
+            if len(batch) >= _BATCH_SIZE or remaining <= 0:
+                break
+            try:
+                item = _line_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+        
+        if batch:
+            console.print("\n".join(batch))
+        for waiter in waiters:
+            waiter.set()
+
+
+def _emit(line: str):
+    """Print a status line, through the batching queue when enabled."""
+    global _writer
+    if not _BUFFERED:
+        console.print(line)
+        return
+    
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = threading.Thread(target=_write_batches, name="perfwatch-console", daemon=True)
+                _writer.start()
+    _line_queue.put(line)
+
+
+def flush_console():
+    """Block until every queued status line has been written."""
+    if _writer is None:
+        return
+    done = threading.Event()
+    _line_queue.put(done)
+    done.wait()
+
+
+atexit.register(flush_console)
+
 
 def setup_logging(verbose: bool = False) -> logging.Logger:
-    """Setup logging with Rich handler."""
-    level = logging.DEBUG if verbose else logging.INFO
+    """Setup logging, with the Rich handler only for verbose output."""
+    if verbose:
+        # Rich tracebacks and markup are worth their per-record cost when debugging
+        from rich.logging import RichHandler
+        
+        handler = RichHandler(console=console, rich_tracebacks=True)
+        handler.setFormatter(logging.Formatter("%(message)s", "[%X]"))
+    else:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s", "[%X]"))
     
     logging.basicConfig(
-        level=level,
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[RichHandler(console=console, rich_tracebacks=True)]
+        level=logging.DEBUG if verbose else logging.INFO,
+        handlers=[handler],
     )
     
     return logging.getLogger("perfwatch")
@@ -35,6 +116,7 @@ def print_header(title: str, subtitle: Optional[str] = None):
     if subtitle:
         content += f"\n[dim]{subtitle}[/dim]"
     
+    flush_console()
     console.print()
     console.print(Panel.fit(content, border_style="cyan"))
     console.print()
@@ -42,31 +124,33 @@ def print_header(title: str, subtitle: Optional[str] = None):
 
 def print_success(message: str):
     """Print a success message."""
-    console.print(f"[green]✓[/green] {message}")
+    _emit(f"[green]✓[/green] {message}")
 
 
 def print_error(message: str):
     """Print an error message."""
-    console.print(f"[red]✗[/red] {message}")
+    _emit(f"[red]✗[/red] {message}")
 
 
 def print_warning(message: str):
     """Print a warning message."""
-    console.print(f"[yellow]⚠[/yellow] {message}")
+    _emit(f"[yellow]⚠[/yellow] {message}")
 
 
 def print_info(message: str):
     """Print an info message."""
-    console.print(f"[blue]ℹ[/blue] {message}")
+    _emit(f"[blue]ℹ[/blue] {message}")
 
 
 def print_step(step: int, total: int, message: str):
     """Print a step indicator."""
-    console.print(f"[dim][{step}/{total}][/dim] {message}")
+    _emit(f"[dim][{step}/{total}][/dim] {message}")
 
 
-def create_progress() -> Progress:
+def create_progress() -> "Progress":
     """Create a Rich progress bar."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+    
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -77,64 +161,86 @@ def create_progress() -> Progress:
     )
 
 
-def print_score_table(scores: dict[str, float], title: str = "Performance Scores"):
-    """Print a table of scores with color coding."""
+# Score cell format and rating cell per score tier, built once from the shared tiers
+_TIER_COLORS = ("green", "yellow", "red")
+_SCORE_STYLES = {
+    label: (f"[{color}]{{:.0f}}[/{color}]".format, f"{icon} {label}")
+    for (_, label, _, icon), color in zip(SCORE_TIERS, _TIER_COLORS)
+}
+
+
+def _make_score_table(title: str):
+    """Create an empty score table with its Metric/Score/Rating columns."""
+    from rich.table import Table
+    
     table = Table(title=title, show_header=True, header_style="bold magenta")
     table.add_column("Metric", style="cyan")
     table.add_column("Score", justify="right")
     table.add_column("Rating", justify="center")
+    return table
+
+
+def _make_metrics_table(title: str):
+    """Create an empty metrics table with its Metric/Value columns."""
+    from rich.table import Table
     
-    for metric, score in scores.items():
-        # Color code based on score
-        if score >= 90:
-            color = "green"
-            rating = "🟢 Good"
-        elif score >= 50:
-            color = "yellow"
-            rating = "🟡 Needs Improvement"
-        else:
-            color = "red"
-            rating = "🔴 Poor"
-        
-        table.add_row(
-            metric,
-            f"[{color}]{score:.0f}[/{color}]",
-            rating
-        )
-    
+    table = Table(title=title, show_header=True, header_style="bold magenta")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", justify="right")
+    return table
+
+
+def _print_table(table):
+    """Print a table with a blank line either side, after any queued lines."""
+    flush_console()
     console.print()
     console.print(table)
     console.print()
 
 
+def print_score_table(scores: dict[str, float], title: str = "Performance Scores"):
+    """Print a table of scores with color coding."""
+    table = _make_score_table(title)
+    
+    for metric, score in scores.items():
+        # Color code based on score
+        format_score, rating = _SCORE_STYLES[classify_score(score)[0]]
+        table.add_row(metric, format_score(score), rating)
+    
+    _print_table(table)
+
+
 def print_metrics_table(metrics: dict[str, str], title: str = "Metrics"):
     """Print a table of metrics."""
-    table = Table(title=title, show_header=True, header_style="bold magenta")
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", justify="right")
+    table = _make_metrics_table(title)
     
     for metric, value in metrics.items():
         table.add_row(metric, str(value))
     
-    console.print()
-    console.print(table)
-    console.print()
+    _print_table(table)
+
+
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# One printf-style template per duration range
+_MS_FORMAT = "%.0fms"
+_SECONDS_FORMAT = "%.2fs"
+_MINUTES_FORMAT = "%dm %.0fs"
 
 
 def format_timestamp(dt: Optional[datetime] = None) -> str:
     """Format datetime for display."""
     if dt is None:
-        dt = datetime.now()
-    return dt.strftime("%Y-%m-%d %H:%M:%S")
+        # The current time needs no datetime object at all
+        return time.strftime(_TIMESTAMP_FORMAT)
+    return dt.strftime(_TIMESTAMP_FORMAT)
 
 
 def format_duration(seconds: float) -> str:
     """Format duration in human readable format."""
     if seconds < 1:
-        return f"{seconds * 1000:.0f}ms"
+        return _MS_FORMAT % (seconds * 1000,)
     elif seconds < 60:
-        return f"{seconds:.2f}s"
+        return _SECONDS_FORMAT % (seconds,)
     else:
-        minutes = int(seconds // 60)
-        secs = seconds % 60
-        return f"{minutes}m {secs:.0f}s"
+        return _MINUTES_FORMAT % (seconds // 60, seconds % 60)
@@ -0,0 +1,30 @@
+"""
+Perfwatch Paths - Filesystem helpers shared by commands.
+"""
+
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Union
+from urllib.parse import urlparse
+
+
+_SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
+
+
+def ensure_dir(path: Union[str, Path]) -> Path:
+    """Create a directory (and its parents) if needed and return it as a Path."""
+    return _ensure_dir(str(path))
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> Path:
+    directory = Path(path)
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory
+
+
+def slugify_url(url: str) -> str:
+    """Turn a URL's host and path into a filename-safe slug."""
+    parsed = urlparse(url)
+    return _SLUG_PATTERN.sub("-", f"{parsed.netloc}{parsed.path}".lower()).strip("-") or "site"
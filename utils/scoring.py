@@ -0,0 +1,23 @@
+"""
+Perfwatch Scoring - Shared score classification.
+"""
+
+# (minimum score, label, color, icon), checked from best to worst
+SCORE_TIERS = (
+    (90, "Good", "#22c55e", "🟢"),
+    (50, "Needs Improvement", "#eab308", "🟡"),
+    (float("-inf"), "Poor", "#ef4444", "🔴"),
+)
+
+
+def classify_score(score: float) -> tuple[str, str, str]:
+    """
+    Classify a 0-100 score.
+    
+    Returns:
+        Tuple of (label, color, icon)
+    """
+    for threshold, label, color, icon in SCORE_TIERS:
+        if score >= threshold:
+            return label, color, icon
+    return SCORE_TIERS[-1][1:]
@@ -0,0 +1,83 @@
+"""
+Perfwatch Serializer - JSON encoding with optional orjson acceleration.
+"""
+
+import json
+from pathlib import Path
+from typing import IO, Any, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional: pip install perfwatch[fast]
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = True) -> str:
+    """
+    Serialize an object to a JSON string.
+    
+    Uses orjson when installed, falling back to the stdlib json module.
+    Non-JSON types are converted with str() in both cases.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=str, option=option).decode("utf-8")
+    
+    if indent:
+        return json.dumps(obj, indent=2, default=str)
+    return json.dumps(obj, separators=(",", ":"), default=str)
+
+
+def write_json(path: Path, obj: Any, indent: bool = True):
+    """
+    Write an object to a UTF-8 JSON file.
+    
+    With orjson the encoded bytes are written directly; the stdlib
+    fallback streams into a buffered file instead of building one string.
+    """
+    path = Path(path)
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        path.write_bytes(orjson.dumps(obj, default=str, option=option))
+        return
+    
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        if indent:
+            json.dump(obj, f, indent=2, default=str)
+        else:
+            json.dump(obj, f, separators=(",", ":"), default=str)
+
+
+def read_json(path: Path) -> Any:
+    """Read a JSON file in one bulk read, parsing with orjson when available."""
+    raw = Path(path).read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class JsonLinesWriter:
+    """Append objects to a newline-delimited JSON file, one line each."""
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._file: Optional[IO[bytes]] = None
+    
+    def __enter__(self) -> "JsonLinesWriter":
+        self._file = self.path.open("ab", buffering=1 << 16)
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._file.close()
+        self._file = None
+    
+    def write(self, obj: Any):
+        """Write one object as a compact JSON line."""
+        if orjson is not None:
+            self._file.write(orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE))
+        else:
+            self._file.write(json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8") + b"\n")
@@ -2,55 +2,97 @@
 Perfwatch Validator - URL and input validation utilities.
 """
 
+import ipaddress
 import re
+from functools import lru_cache
 from urllib.parse import urlparse, urlunparse
-from typing import Optional
+from typing import Iterable, Optional
 
 
-def validate_url(url: str) -> tuple[bool, Optional[str]]:
+# Compiled once at import instead of looked up in re's cache on every call
+_DOMAIN_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?)*\.[a-zA-Z]{2,}$')
+
+_SCHEMES = ('http://', 'https://')
+
+
+def _ensure_scheme(url: str) -> str:
+    """Prefix https:// unless the URL already starts with a supported scheme."""
+    if url.startswith(_SCHEMES):
+        return url
+    return 'https://' + url
+
+
+# The public helpers are pure functions of the input string returning
+# immutable values, so results are memoized for repeated and batch runs
+@lru_cache(maxsize=1024)
+def validate(url: str) -> tuple[bool, Optional[str], str]:
     """
-    Validate a URL.
+    Validate a URL and return its host from the same parse.
     
     Returns:
-        Tuple of (is_valid, error_message)
+        Tuple of (is_valid, error_message, domain), where domain is the
+        lowercased host without port, or "" when the URL is invalid
     """
     if not url:
-        return False, "URL cannot be empty"
+        return False, "URL cannot be empty", ""
     
     # Add scheme if missing
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
+    url = _ensure_scheme(url)
     
     try:
         parsed = urlparse(url)
         
         # Check for valid scheme
         if parsed.scheme not in ('http', 'https'):
-            return False, f"Invalid scheme: {parsed.scheme}. Must be http or https"
+            return False, f"Invalid scheme: {parsed.scheme}. Must be http or https", ""
         
         # Check for valid netloc (domain)
         if not parsed.netloc:
-            return False, "Invalid URL: missing domain"
-        
-        # Basic domain validation
-        domain_pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?)*\.[a-zA-Z]{2,}$'
+            return False, "Invalid URL: missing domain", ""
         
         # Extract domain without port
         domain = parsed.netloc.split(':')[0]
         
         # Allow localhost and IP addresses for testing
         if domain == 'localhost' or _is_valid_ip(domain):
-            return True, None
+            return True, None, domain.lower()
         
-        if not re.match(domain_pattern, domain):
-            return False, f"Invalid domain: {domain}"
+        if not _is_valid_domain(domain):
+            return False, f"Invalid domain: {domain}", ""
         
-        return True, None
+        return True, None, domain.lower()
         
     except Exception as e:
-        return False, f"Invalid URL: {str(e)}"
+        return False, f"Invalid URL: {str(e)}", ""
+
+
+def validate_url(url: str) -> tuple[bool, Optional[str]]:
+    """
+    Validate a URL.
+    
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    is_valid, error, _ = validate(url)
+    return is_valid, error
 
 
+def validate_urls(urls: Iterable[str]) -> list[tuple[bool, Optional[str]]]:
+    """
+    Validate a batch of URLs.
+    
+    Each distinct URL is checked once, so repeated entries in large lists
+    cost a dict lookup even after they have fallen out of validate()'s cache.
+    
+    Returns:
+        List of (is_valid, error_message), in input order
+    """
+    urls = list(urls)
+    results = {url: validate(url)[:2] for url in dict.fromkeys(urls)}
+    return [results[url] for url in urls]
+
+
+@lru_cache(maxsize=1024)
 def validate_domain(domain: str) -> tuple[bool, Optional[str]]:
     """
     Validate a domain name.
@@ -71,15 +113,13 @@ def validate_domain(domain: str) -> tuple[bool, Optional[str]]:
     # Remove port if present
     domain = domain.split(':')[0]
     
-    # Domain validation pattern
-    domain_pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?(\.[a-zA-Z0-9]([a-zA-Z0-9-]*[a-zA-Z0-9])?)*\.[a-zA-Z]{2,}$'
-    
-    if not re.match(domain_pattern, domain):
+    if not _is_valid_domain(domain):
         return False, f"Invalid domain format: {domain}"
     
     return True, None
 
 
+@lru_cache(maxsize=1024)
 def normalize_url(url: str) -> str:
     """
     Normalize a URL by adding scheme if missing and cleaning up.
@@ -88,9 +128,41 @@ def normalize_url(url: str) -> str:
         return url
     
     # Add https if no scheme
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
-    
+    url = _ensure_scheme(url)
+    
+    # Plain ASCII URLs are split by hand; anything else (whitespace or
+    # control characters urlsplit strips, IPv6 hosts it validates,
+    # non-ASCII hosts it NFKC-checks) goes through urlparse
+    if not url.isascii() or not url.isprintable() or url[0] == ' ' or '[' in url or ']' in url:
+        return _normalize_url_slow(url)
+    
+    scheme, _, rest = url.partition('://')
+    
+    # The host ends at the first path, query or fragment delimiter
+    end = len(rest)
+    for delimiter in '/?#':
+        index = rest.find(delimiter, 0, end)
+        if index >= 0:
+            end = index
+    netloc, rest = rest[:end], rest[end:]
+    if not netloc:
+        # urlunparse rebuilds host-less URLs differently; defer to it
+        return _normalize_url_slow(url)
+    
+    # Drop the fragment, then split off the query
+    rest = rest.partition('#')[0]
+    path, _, query = rest.partition('?')
+    if ';' in path:
+        # Path parameters are re-joined with their own rules by urlunparse
+        return _normalize_url_slow(url)
+    
+    if query:
+        return f"{scheme}://{netloc.lower()}{path or '/'}?{query}"
+    return f"{scheme}://{netloc.lower()}{path or '/'}"
+
+
+def _normalize_url_slow(url: str) -> str:
+    """Reference normalization through urlparse, for URLs the fast split can't take."""
     parsed = urlparse(url)
     
     # Rebuild URL with normalized components
@@ -106,26 +178,51 @@ def normalize_url(url: str) -> str:
     return normalized
 
 
-def _is_valid_ip(ip: str) -> bool:
-    """Check if string is a valid IP address."""
-    # IPv4 pattern
-    ipv4_pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
+def _is_valid_domain(domain: str) -> bool:
+    """
+    Check a domain against the same rules as _DOMAIN_RE without the regex VM.
     
-    if re.match(ipv4_pattern, ip):
-        # Validate each octet
-        octets = ip.split('.')
-        return all(0 <= int(octet) <= 255 for octet in octets)
+    Labels are checked with str methods after one split, so the cost stays
+    linear even for long or hostile input, where the pattern backtracks.
+    """
+    # Non-ASCII and newlines hit re-specific behaviour; let the pattern decide
+    if not domain.isascii() or "\n" in domain:
+        return _DOMAIN_RE.match(domain) is not None
+    
+    *labels, tld = domain.split(".")
+    if not labels or len(tld) < 2 or not tld.isalpha():
+        return False
+    
+    for label in labels:
+        # Alphanumerics with inner hyphens only
+        if not label or label[0] == "-" or label[-1] == "-" or not label.replace("-", "").isalnum():
+            return False
     
-    return False
+    return True
+
+
+def _is_valid_ip(ip: str) -> bool:
+    """Check if string is a valid IP address."""
+    try:
+        ipaddress.ip_address(ip)
+    except ValueError:
+        return False
+    return True
 
 
+@lru_cache(maxsize=1024)
 def extract_domain(url: str) -> str:
     """Extract domain from URL."""
     if not url:
         return ""
     
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
+    url = _ensure_scheme(url)
     
     parsed = urlparse(url)
     return parsed.netloc.split(':')[0]
+
+
+def clear_caches():
+    """Drop every memoized validation result (mainly for tests)."""
+    for func in (validate, validate_domain, normalize_url, extract_domain):
+        func.cache_clear()